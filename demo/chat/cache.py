@@ -0,0 +1,112 @@
+"""Session Caches
+
+In-process caches used by ChatSession to skip repeated work within a session.
+"""
+
+import re
+from collections import OrderedDict
+from typing import Any, FrozenSet, Optional, Tuple
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_LATIN_WORD_RE = re.compile(r"[^\W_\u4e00-\u9fff]+")
+_CJK_RUN_RE = re.compile(r"[\u4e00-\u9fff]+")
+_TRAILING_PUNCTUATION = "?？!！.。~～"
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a user query for cache lookup
+
+    Case, repeated whitespace and trailing punctuation are ignored, so
+    "What did we decide?" and "what did we decide" share one entry.
+
+    Args:
+        query: Raw user input
+
+    Returns:
+        Normalized cache key
+    """
+    collapsed = _WHITESPACE_RE.sub(" ", query).strip()
+    return collapsed.rstrip(_TRAILING_PUNCTUATION).strip().casefold()
+
+
+def query_tokens(query: str) -> FrozenSet[str]:
+    """Token set of a normalized query for similarity lookup
+
+    Latin words are kept whole; Chinese runs, which have no word boundaries,
+    contribute character bigrams (or the single character for a 1-char run).
+
+    Args:
+        query: Raw user input
+
+    Returns:
+        Set of tokens
+    """
+    normalized = normalize_query(query)
+    tokens = set(_LATIN_WORD_RE.findall(normalized))
+    for run in _CJK_RUN_RE.findall(normalized):
+        if len(run) == 1:
+            tokens.add(run)
+        else:
+            tokens.update(run[i : i + 2] for i in range(len(run) - 1))
+    return frozenset(tokens)
+
+
+class RetrievalCache:
+    """Similarity-keyed LRU cache of retrieval results
+
+    A lookup returns the entry whose query is most similar (Jaccard overlap of
+    `query_tokens`) to the new one, provided the similarity reaches
+    `min_similarity`. Near-identical rewordings of an earlier question then
+    reuse its memories instead of calling the search API again.
+    """
+
+    def __init__(self, capacity: int = 64, min_similarity: float = 0.88):
+        """Initialize retrieval cache
+
+        Args:
+            capacity: Maximum number of cached results (0 disables caching)
+            min_similarity: Minimum query similarity (0-1] counted as a hit
+        """
+        if not 0.0 < min_similarity <= 1.0:
+            raise ValueError(f"min_similarity must be in (0, 1], got {min_similarity}")
+        self.capacity = max(0, capacity)
+        self.min_similarity = min_similarity
+        self._entries: "OrderedDict[FrozenSet[str], Any]" = OrderedDict()
+
+    def get(self, query: str) -> Optional[Any]:
+        """Return the result cached for the most similar query, if close enough"""
+        if not self.capacity or not self._entries:
+            return None
+        tokens = query_tokens(query)
+        if not tokens:
+            return None
+
+        best: Optional[Tuple[float, FrozenSet[str]]] = None
+        for key in self._entries:
+            similarity = len(tokens & key) / len(tokens | key)
+            if best is None or similarity > best[0]:
+                best = (similarity, key)
+
+        if best is None or best[0] < self.min_similarity:
+            return None
+        self._entries.move_to_end(best[1])
+        return self._entries[best[1]]
+
+    def put(self, query: str, result: Any) -> None:
+        """Cache a result, evicting the least recently used entry when full"""
+        if not self.capacity:
+            return
+        tokens = query_tokens(query)
+        if not tokens:
+            return
+        self._entries[tokens] = result
+        self._entries.move_to_end(tokens)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -8,18 +8,18 @@ Responsible for the orchestration of the entire chat application:
 """
 
 import asyncio
+import atexit
+import inspect
 import logging
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from demo.config import ChatModeConfig, LLMConfig, MongoDBConfig
-from demo.utils import ensure_mongo_beanie_ready
 from demo.ui import I18nTexts
-from common_utils.cli_ui import CLIUI
 
 from .session import ChatSession
-from .ui import ChatUI
+from .ui import ChatUI, ainput
 from .selectors import LanguageSelector, ScenarioSelector, GroupSelector
 
 
@@ -29,24 +29,48 @@ class ChatOrchestrator:
     def __init__(self, project_root: Path):
         self.project_root = project_root
         self.history_file = project_root / "demo" / ".chat_history"
+        # Set by setup_readline() when each input can be appended to the file
+        self._readline_append = None
         self._configure_logging()
     
     def _configure_logging(self):
         """Configure logging - Hide DEBUG logs from third-party libraries"""
         logging.basicConfig(level=logging.WARNING, format='%(levelname)s: %(message)s')
         logging.getLogger().setLevel(logging.WARNING)
+        # Drop INFO/DEBUG calls before any LogRecord is built, even on loggers
+        # that libraries configure with a lower level of their own
+        logging.disable(logging.INFO)
         
         # Disable common third-party library logs
         for logger_name in ['jieba', 'elasticsearch', 'urllib3', 'pymongo', 'pymilvus']:
             logging.getLogger(logger_name).setLevel(logging.ERROR)
     
     def setup_readline(self):
-        """Configure readline history"""
+        """Configure readline history
+        
+        Chat inputs are appended to the history file as they are entered (see
+        record_input), so nothing is lost on a crash. Where readline lacks
+        append_history_file, history is written back at interpreter exit.
+        """
         try:
             import readline
             if self.history_file.exists():
                 readline.read_history_file(str(self.history_file))
             readline.set_history_length(1000)
+            if hasattr(readline, "append_history_file"):
+                self.history_file.touch(exist_ok=True)
+                self._readline_append = readline.append_history_file
+            else:
+                atexit.register(self.save_readline_history)
+        except Exception:
+            pass
+    
+    def record_input(self):
+        """Append the most recent input line to the history file"""
+        if self._readline_append is None:
+            return
+        try:
+            self._readline_append(1, str(self.history_file))
         except Exception:
             pass
     
@@ -60,35 +84,41 @@ class ChatOrchestrator:
     
     async def select_language(self) -> I18nTexts:
         """Language selection"""
-        language = LanguageSelector.select_language()
+        language = await LanguageSelector.select_language()
         return I18nTexts(language)
     
     async def select_scenario(self, texts: I18nTexts) -> Optional[str]:
         """Scenario selection"""
-        ChatUI.clear_screen()
-        ChatUI.print_banner(texts)
-        
-        scenario_type = ScenarioSelector.select_scenario(texts)
+        scenario_type = await ScenarioSelector.select_scenario(texts)
         if not scenario_type:
             ChatUI.print_info(texts.get("groups_not_selected_exit"), texts)
             return None
         
         return scenario_type
     
-    async def initialize_database(self, texts: I18nTexts) -> bool:
-        """Initialize database connection"""
-        mongo_config = MongoDBConfig()
+    async def load_groups(self) -> Tuple[str, List[Dict[str, Any]]]:
+        """Initialize database connection and list available groups
         
-        try:
-            await ensure_mongo_beanie_ready(mongo_config)
-            return True
-        except Exception as e:
-            ChatUI.print_error(texts.get("mongodb_init_failed", error=str(e)), texts)
-            return False
+        Prints nothing, so it can run in the background while a prompt is
+        on screen; the caller reports the outcome when awaiting it.
+        
+        Returns:
+            Name of the connected database and the list of groups
+            
+        Raises:
+            Exception: If the database is unavailable or listing groups fails
+        """
+        # Imported on first use: pulls in pymongo, beanie and document models
+        from demo.utils import ensure_mongo_beanie_ready
+        
+        mongo_config = MongoDBConfig()
+        await ensure_mongo_beanie_ready(mongo_config, verbose=False)
+        return mongo_config.database, await GroupSelector.list_available_groups()
     
-    async def select_group(self, texts: I18nTexts) -> Optional[str]:
+    async def select_group(
+        self, groups: List[Dict[str, Any]], texts: I18nTexts
+    ) -> Optional[str]:
         """Group selection"""
-        groups = await GroupSelector.list_available_groups()
         selected_group_id = await GroupSelector.select_group(groups, texts)
         
         if not selected_group_id:
@@ -106,16 +136,22 @@ class ChatOrchestrator:
         Returns:
             Retrieval mode string
         """
-        ui = CLIUI()
+        ui = ChatUI._ui()
         print()
         ui.section_heading(texts.get("retrieval_mode_selection_title"))
-        print()
-        print(f"  [1] {texts.get('retrieval_mode_keyword')} - {texts.get('retrieval_mode_keyword_desc')}")
-        print(f"  [2] {texts.get('retrieval_mode_vector')} - {texts.get('retrieval_mode_vector_desc')}")
-        print(f"  [3] {texts.get('retrieval_mode_hybrid')} - {texts.get('retrieval_mode_hybrid_desc')}")
-        print(f"  [4] {texts.get('retrieval_mode_rrf')} - {texts.get('retrieval_mode_rrf_desc')}")
-        print(f"  [5] {texts.get('retrieval_mode_agentic')} - {texts.get('retrieval_mode_agentic_desc')}")
-        print()
+        ChatUI.print_menu(
+            "retrieval_mode",
+            texts,
+            lambda: [
+                "",
+                f"  [1] {texts.get('retrieval_mode_keyword')} - {texts.get('retrieval_mode_keyword_desc')}",
+                f"  [2] {texts.get('retrieval_mode_vector')} - {texts.get('retrieval_mode_vector_desc')}",
+                f"  [3] {texts.get('retrieval_mode_hybrid')} - {texts.get('retrieval_mode_hybrid_desc')}",
+                f"  [4] {texts.get('retrieval_mode_rrf')} - {texts.get('retrieval_mode_rrf_desc')}",
+                f"  [5] {texts.get('retrieval_mode_agentic')} - {texts.get('retrieval_mode_agentic_desc')}",
+                "",
+            ],
+        )
         
         mode_map = {1: "keyword", 2: "vector", 3: "hybrid", 4: "rrf", 5: "agentic"}
         mode_desc = {
@@ -128,7 +164,7 @@ class ChatOrchestrator:
         
         while True:
             try:
-                choice = input(f"{texts.get('retrieval_mode_prompt')}: ").strip()
+                choice = (await ainput(f"{texts.get('retrieval_mode_prompt')}: ")).strip()
                 if not choice:
                     continue
                 
@@ -211,39 +247,49 @@ class ChatOrchestrator:
         ChatUI.print_banner(texts)
         
         # Show start note
-        ui = CLIUI()
+        ui = ChatUI._ui()
         print()
         ui.rule()
         ui.note(texts.get("chat_start_note"), icon="💬")
         ui.rule()
         print()
         
+        async def reload() -> None:
+            GroupSelector.invalidate()
+            await session.reload_data()
+        
+        # Resolved once for the whole loop
+        prompt = texts.get("chat_input_prompt")
+        commands: Dict[str, Callable[[], Any]] = {
+            "clear": session.clear_history,
+            "reload": reload,
+            "help": lambda: ChatUI.print_help(texts),
+        }
+        
         while True:
             try:
-                user_input = input(texts.get("chat_input_prompt")).strip()
+                user_input = (await ainput(prompt)).strip()
                 
                 if not user_input:
                     continue
+                self.record_input()
                 
+                # Handle commands; anything else goes straight to chat
                 command = user_input.lower()
-                
-                # Handle commands
                 if command == "exit":
                     await self._handle_exit(session, texts)
                     break
-                elif command == "clear":
-                    session.clear_history()
-                    continue
-                elif command == "reload":
-                    await session.reload_data()
-                    continue
-                elif command == "help":
-                    ChatUI.print_help(texts)
+                if command in commands:
+                    result = commands[command]()
+                    if inspect.isawaitable(result):
+                        await result
                     continue
                 
                 # Execute chat
                 response = await session.chat(user_input)
-                ChatUI.print_assistant_response(response, texts)
+                ChatUI.print_assistant_response(
+                    response, texts, streamed=session.last_response_streamed
+                )
             
             except KeyboardInterrupt:
                 await self._handle_interrupt(session, texts)
@@ -257,7 +303,7 @@ class ChatOrchestrator:
     
     async def _handle_exit(self, session: ChatSession, texts: I18nTexts):
         """Handle exit command"""
-        ui = CLIUI()
+        ui = ChatUI._ui()
         print()
         ui.note(texts.get("cmd_exit_saving"), icon="💾")
         await session.save_conversation_history()
@@ -267,7 +313,7 @@ class ChatOrchestrator:
     
     async def _handle_interrupt(self, session: ChatSession, texts: I18nTexts):
         """Handle interrupt signal"""
-        ui = CLIUI()
+        ui = ChatUI._ui()
         print("\n")
         ui.note(texts.get("cmd_interrupt_saving"), icon="⚠️")
         await session.save_conversation_history()
@@ -277,51 +323,69 @@ class ChatOrchestrator:
     
     async def run(self):
         """Run chat application main flow"""
-        # 1. Initialize readline
-        self.setup_readline()
-        
-        # 2. Clear screen, then language selection
+        # 1. Clear screen, then language selection
         ChatUI.clear_screen()
         texts = await self.select_language()
         
-        # 3. Scenario selection
+        # Initialize database and list groups in the background while the
+        # user goes through the next menus
+        prefetch = asyncio.ensure_future(self.load_groups())
+        try:
+            await self._run_after_language(texts, prefetch)
+        finally:
+            if prefetch.done() and not prefetch.cancelled():
+                # Retrieve the error of a prefetch nobody awaited (early exit)
+                # so asyncio does not log it as never retrieved
+                prefetch.exception()
+            prefetch.cancel()
+    
+    async def _run_after_language(self, texts: I18nTexts, prefetch: asyncio.Future):
+        """Main flow after language selection
+        
+        Args:
+            texts: I18nTexts object
+            prefetch: Pending result of `load_groups`
+        """
+        # 2. Scenario selection
         scenario_type = await self.select_scenario(texts)
         if not scenario_type:
             return
         
-        # 4. Clear screen
-        ChatUI.clear_screen()
-        ChatUI.print_banner(texts)
+        # 3. The selection steps render inline below each other; the screen is
+        #    cleared and the banner drawn once, when the chat loop starts
         
-        # 5. Verify API Key
+        # 4. Verify API Key
         llm_config = LLMConfig()
         if not self.verify_api_key(llm_config, texts):
             return
         
-        # 6. Initialize database
-        if not await self.initialize_database(texts):
+        # 5. Wait for database initialization and group listing, loading
+        #    readline history from disk concurrently (no prompt is active)
+        try:
+            (database, groups), _ = await asyncio.gather(
+                prefetch, asyncio.to_thread(self.setup_readline)
+            )
+        except Exception as e:
+            ChatUI.print_error(texts.get("groups_load_failed", error=str(e)), texts)
             return
+        print(f"[MongoDB] ✅ Connected: {database}")
         
-        # 7. Group selection
-        group_id = await self.select_group(texts)
+        # 6. Group selection
+        group_id = await self.select_group(groups, texts)
         if not group_id:
             return
         
-        # 8. Retrieval mode selection
+        # 7. Retrieval mode selection
         try:
             retrieval_mode = await self.select_retrieval_mode(texts)
         except KeyboardInterrupt:
             print("\n")
             return
         
-        # 9. Create session
+        # 8. Create session
         session = await self.create_session(group_id, scenario_type, retrieval_mode, texts)
         if not session:
             return
         
-        # 10. Run conversation loop
+        # 9. Run conversation loop
         await self.run_chat_loop(session, texts)
-        
-        # 11. Save history
-        self.save_readline_history()
-
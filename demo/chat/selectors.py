@@ -3,40 +3,54 @@
 Provides selection for language, scenario, and groups.
 """
 
-from typing import List, Dict, Any, Optional
+import sys
+import time
+from typing import List, Dict, Any, Optional, Tuple
 
 from demo.config import ScenarioType
-from demo.utils import query_all_groups_from_mongodb
 from demo.ui import I18nTexts
-from common_utils.cli_ui import CLIUI
+
+from .ui import ChatUI, ainput
+
+# Group listing cache: (monotonic timestamp, transformed group list)
+_GROUPS_CACHE: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+_GROUPS_CACHE_TTL_SECONDS = 60.0
+
+# Bilingual language menu (shown before a language is chosen)
+_LANGUAGE_MENU = "\n".join(
+    [
+        "",
+        "=" * 60,
+        "  🌏  语言选择 / Language Selection",
+        "=" * 60,
+        "",
+        "  [1] 中文 (Chinese)",
+        "  [2] English",
+        "",
+        # Language consistency hint
+        "  💡 提示：为获得最佳体验，建议记忆数据与选择的语言保持一致",
+        "     Note: For best experience, memory data should match the selected language",
+        "",
+        "",
+    ]
+)
 
 
 class LanguageSelector:
     """Language Selector"""
     
     @staticmethod
-    def select_language() -> str:
+    async def select_language() -> str:
         """Interactive language selection
         
         Returns:
             Language code: "zh" or "en"
         """
-        print()
-        print("=" * 60)
-        print("  🌏  语言选择 / Language Selection")
-        print("=" * 60)
-        print()
-        print("  [1] 中文 (Chinese)")
-        print("  [2] English")
-        print()
-        # Language consistency hint
-        print("  💡 提示：为获得最佳体验，建议记忆数据与选择的语言保持一致")
-        print("     Note: For best experience, memory data should match the selected language")
-        print()
+        sys.stdout.write(_LANGUAGE_MENU)
         
         while True:
             try:
-                choice = input("请选择语言 / Please select language [1-2]: ").strip()
+                choice = (await ainput("请选择语言 / Please select language [1-2]: ")).strip()
                 if not choice:
                     continue
                 
@@ -61,7 +75,7 @@ class ScenarioSelector:
     """Scenario Mode Selector"""
     
     @staticmethod
-    def select_scenario(texts: I18nTexts) -> Optional[ScenarioType]:
+    async def select_scenario(texts: I18nTexts) -> Optional[ScenarioType]:
         """Interactive scenario selection
         
         Args:
@@ -70,22 +84,26 @@ class ScenarioSelector:
         Returns:
             ScenarioType or None (Cancelled)
         """
-        ui = CLIUI()
+        ui = ChatUI._ui()
         print()
         ui.section_heading(texts.get("scenario_selection_title"))
-        print()
-        
-        print(f"  [1] {texts.get('scenario_assistant')}")
-        print(f"      {texts.get('scenario_assistant_desc')}")
-        print()
-        
-        print(f"  [2] {texts.get('scenario_group_chat')}")
-        print(f"      {texts.get('scenario_group_chat_desc')}")
-        print()
+        ChatUI.print_menu(
+            "scenario",
+            texts,
+            lambda: [
+                "",
+                f"  [1] {texts.get('scenario_assistant')}",
+                f"      {texts.get('scenario_assistant_desc')}",
+                "",
+                f"  [2] {texts.get('scenario_group_chat')}",
+                f"      {texts.get('scenario_group_chat_desc')}",
+                "",
+            ],
+        )
         
         while True:
             try:
-                choice = input(f"{texts.get('scenario_prompt')}: ").strip()
+                choice = (await ainput(f"{texts.get('scenario_prompt')}: ")).strip()
                 if not choice:
                     continue
                 
@@ -109,21 +127,44 @@ class ScenarioSelector:
 class GroupSelector:
     """Group Selector"""
     
+    # Display-name aliases for known group IDs
+    _GROUP_ALIAS: Dict[str, str] = {"AI产品群": "group_chat"}
+    
     @staticmethod
     async def list_available_groups() -> List[Dict[str, Any]]:
         """List all available groups
         
+        Results are cached in-process for a short TTL, so repeated menu
+        entries within a session do not hit MongoDB again.
+        
         Returns:
             List of groups
         """
+        global _GROUPS_CACHE
+        
+        if _GROUPS_CACHE is not None:
+            cached_at, cached_groups = _GROUPS_CACHE
+            if time.monotonic() - cached_at < _GROUPS_CACHE_TTL_SECONDS:
+                return [dict(group) for group in cached_groups]
+        
+        from demo.utils import query_all_groups_from_mongodb
+        
         groups = await query_all_groups_from_mongodb()
         
+        alias = GroupSelector._GROUP_ALIAS
         for idx, group in enumerate(groups, start=1):
             group["index"] = idx
             group_id = group["group_id"]
-            group["name"] = "group_chat" if group_id == "AI产品群" else group_id
+            group["name"] = alias.get(group_id, group_id)
         
-        return groups
+        _GROUPS_CACHE = (time.monotonic(), groups)
+        return [dict(group) for group in groups]
+    
+    @staticmethod
+    def invalidate() -> None:
+        """Drop the cached group listing (e.g. after `reload`)"""
+        global _GROUPS_CACHE
+        _GROUPS_CACHE = None
     
     @staticmethod
     async def select_group(groups: List[Dict[str, Any]], texts: I18nTexts) -> Optional[str]:
@@ -136,8 +177,6 @@ class GroupSelector:
         Returns:
             Selected group_id or None (Cancelled)
         """
-        from .ui import ChatUI
-        
         if not groups:
             ChatUI.print_error(texts.get("groups_not_found"), texts)
             print(f"{texts.get('groups_extract_hint')}\n")
@@ -147,7 +186,9 @@ class GroupSelector:
         
         while True:
             try:
-                choice = input(f"\n{texts.get('groups_select_prompt')} [1-{len(groups)}]: ").strip()
+                choice = (
+                    await ainput(f"\n{texts.get('groups_select_prompt')} [1-{len(groups)}]: ")
+                ).strip()
                 if not choice:
                     continue
                 
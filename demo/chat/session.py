@@ -3,18 +3,104 @@
 Manages conversation sessions for a single group, providing memory retrieval and LLM chat functionality.
 """
 
-import json
+import asyncio
+import hashlib
+from collections import deque
+import mmap
+import time
+import aiofiles
 import httpx
-from typing import List, Dict, Any, Optional, Tuple
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Sequence, Tuple
 from datetime import timedelta
 from pathlib import Path
 
 from demo.config import ChatModeConfig, LLMConfig, ScenarioType
-from demo.utils import query_memcells_by_group_and_time
+from demo.utils import json_dumps, json_loads
 from demo.ui import I18nTexts
-from memory_layer.llm.llm_provider import LLMProvider
 from common_utils.datetime_utils import get_now_with_timezone, to_iso_format
-from memory_layer.memory_extractor.profile_memory_life.types import ProfileMemoryLife
+
+from .cache import RetrievalCache
+from .ui import AnswerStream, ChatUI
+
+if TYPE_CHECKING:
+    from memory_layer.llm.llm_provider import LLMProvider
+
+
+def _profile_content_hash(profile_data: Dict[str, Any]) -> str:
+    """Stable SHA-256 of a profile payload, used as a render-cache key."""
+    payload = json_dumps(profile_data, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _memories_with_scores(
+    memories: List[Any], scores: Sequence[Any]
+) -> List[Dict[str, Any]]:
+    """Copy one group's memory dicts, attaching its positional score if absent"""
+    n_scores = len(scores)
+    return [
+        {**m, "score": scores[i]} if i < n_scores and "score" not in m else dict(m)
+        for i, m in enumerate(memories)
+        if isinstance(m, dict)
+    ]
+
+
+def _latest_history_file(history_dir: Path, display_name: str) -> Optional[Path]:
+    """Most recent history file (`.jsonl` or legacy `.json`) for a group"""
+    history_files = [
+        path
+        for path in history_dir.glob(f"{display_name}_*.json*")
+        if path.suffix in (".json", ".jsonl")
+    ]
+    return max(history_files, key=lambda path: path.stem, default=None)
+
+
+def _ends_with_newline(path: Path) -> bool:
+    """Whether a history file is empty or its last record is complete"""
+    with path.open("rb") as f:
+        if f.seek(0, 2) == 0:
+            return True
+        f.seek(-1, 2)
+        return f.read(1) == b"\n"
+
+
+def _read_history_tail(path: Path, limit: int) -> List[Dict[str, Any]]:
+    """Parse only the last `limit` turns of an NDJSON history file
+
+    Lines are located by scanning backwards through a memory map, so loading
+    does not depend on how long the history has grown. Reading stops at the
+    most recent clear marker.
+
+    Args:
+        path: History file (one JSON record per line)
+        limit: Maximum number of turns to return
+
+    Returns:
+        Turn records in chronological order
+    """
+    records: List[Dict[str, Any]] = []
+    with path.open("rb") as f:
+        if limit <= 0 or path.stat().st_size == 0:
+            return records
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            while end > 0 and len(records) < limit:
+                newline = mm.rfind(b"\n", 0, end)
+                line = mm[newline + 1 : end]
+                end = max(newline, 0)
+                if not line.strip():
+                    continue
+                try:
+                    record = json_loads(line)
+                except ValueError:
+                    # Torn last line from an interrupted write
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                if record.get("cleared"):
+                    break
+                records.append(record)
+    records.reverse()
+    return records
 
 
 class ChatSession:
@@ -53,11 +139,14 @@ class ChatSession:
         self.texts = texts
 
         # Session State
-        self.conversation_history: List[Tuple[str, str]] = []
+        # Bounded to the turns the prompt includes; older turns are evicted
+        self.conversation_history: deque[Tuple[str, str]] = deque(
+            maxlen=config.conversation_history_size
+        )
         self.memcell_count: int = 0
 
         # Services
-        self.llm_provider: Optional[LLMProvider] = None
+        self.llm_provider: Optional["LLMProvider"] = None
 
         # API Configuration
         self.api_base_url = config.api_base_url
@@ -66,6 +155,33 @@ class ChatSession:
         # Last Retrieval Metadata
         self.last_retrieval_metadata: Optional[Dict[str, Any]] = None
 
+        # Rendered readable profiles keyed by profile content hash
+        self._readable_profile_cache: Dict[str, str] = {}
+
+        # Retrieved memories keyed by query, matched by query similarity
+        self._retrieval_cache = RetrievalCache(
+            config.retrieval_cache_size, config.retrieval_cache_similarity
+        )
+
+        # History file for this session (fixed on first save) and the pending
+        # background autosave, if any
+        self._history_file: Optional[Path] = None
+        self._save_task: Optional[asyncio.Task] = None
+
+        # Set when the resumed history file ends in a torn line, so the first
+        # append starts on a fresh line instead of extending the fragment
+        self._history_needs_newline = False
+
+        # (monotonic fetch time, profiles) from the last profile fetch
+        self._profile_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+
+        # System prompt depends only on the session language
+        lang_key = "zh" if texts.language == "zh" else "en"
+        self._system_prompt = texts.get(f"prompt_system_role_{lang_key}")
+
+        # Whether the last chat() answer was already printed while streaming
+        self.last_response_streamed = False
+
     async def initialize(self) -> bool:
         """Initialize session
 
@@ -82,22 +198,22 @@ class ChatSession:
                 f"\n[{self.texts.get('loading_label')}] {self.texts.get('loading_group_data', name=display_name)}"
             )
 
-            # Check API Server Health
-            await self._check_api_server()
+            # Check API server health, count MemCells, load conversation
+            # history and fetch the user profile concurrently (independent I/O)
+            from demo.utils import count_memcells_by_group_and_time
 
-            # Count MemCells
             now = get_now_with_timezone()
             start_date = now - timedelta(days=self.config.time_range_days)
-            memcells = await query_memcells_by_group_and_time(
-                self.group_id, start_date, now
+            _, self.memcell_count, loaded_history_count, _ = await asyncio.gather(
+                self._check_api_server(),
+                count_memcells_by_group_and_time(self.group_id, start_date, now),
+                self.load_conversation_history(),
+                self._prefetch_profiles(),
             )
-            self.memcell_count = len(memcells)
             print(
                 f"[{self.texts.get('loading_label')}] {self.texts.get('loading_memories_success', count=self.memcell_count)} ✅"
             )
 
-            # Load Conversation History
-            loaded_history_count = await self.load_conversation_history()
             if loaded_history_count > 0:
                 print(
                     f"[{self.texts.get('loading_label')}] {self.texts.get('loading_history_success', count=loaded_history_count)} ✅"
@@ -108,6 +224,8 @@ class ChatSession:
                 )
 
             # Create LLM Provider
+            from memory_layer.llm.llm_provider import LLMProvider
+
             self.llm_provider = LLMProvider(
                 self.llm_config.provider,
                 model=self.llm_config.model,
@@ -155,6 +273,9 @@ class ChatSession:
     async def load_conversation_history(self) -> int:
         """Load conversation history from file
 
+        Reads the latest history file: append-only NDJSON (`.jsonl`), or a
+        JSON snapshot (`.json`) written by earlier versions.
+
         Returns:
             Number of loaded conversation turns
         """
@@ -164,23 +285,31 @@ class ChatSession:
                 if self.group_id == "AI产品群"  # skip-i18n-check
                 else self.group_id
             )
-            history_files = sorted(
-                self.config.chat_history_dir.glob(f"{display_name}_*.json"),
-                reverse=True,
+            # Directory scan and file reads run in threads to keep the loop free
+            latest_file = await asyncio.to_thread(
+                _latest_history_file, self.config.chat_history_dir, display_name
             )
-
-            if not history_files:
+            if latest_file is None:
                 return 0
 
-            latest_file = history_files[0]
-            with latest_file.open("r", encoding="utf-8") as fp:
-                data = json.load(fp)
+            limit = self.config.conversation_history_size
+            if latest_file.suffix == ".jsonl":
+                history = await asyncio.to_thread(
+                    _read_history_tail, latest_file, limit
+                )
+                # Keep appending to the same log
+                self._history_file = latest_file
+                self._history_needs_newline = not await asyncio.to_thread(
+                    _ends_with_newline, latest_file
+                )
+            else:
+                data = json_loads(await asyncio.to_thread(latest_file.read_bytes))
+                history = data.get("conversation_history", [])[-limit:]
 
-            history = data.get("conversation_history", [])
-            self.conversation_history = [
-                (item["user_input"], item["assistant_response"])
-                for item in history[-self.config.conversation_history_size :]
-            ]
+            self.conversation_history.clear()
+            self.conversation_history.extend(
+                (item["user_input"], item["assistant_response"]) for item in history
+            )
 
             return len(self.conversation_history)
 
@@ -190,47 +319,95 @@ class ChatSession:
             )
             return 0
 
-    async def save_conversation_history(self) -> None:
-        """Save conversation history to file"""
-        try:
+    @staticmethod
+    def _turn_record(user_q: str, assistant_a: str) -> Dict[str, Any]:
+        """History file record for one conversation turn"""
+        return {
+            "timestamp": get_now_with_timezone().isoformat(),
+            "user_input": user_q,
+            "assistant_response": assistant_a,
+        }
+
+    def _schedule_append(self, records: List[Dict[str, Any]]) -> None:
+        """Append records to the history file in a background task
+
+        The first write of a session creates a new file seeded with the turns
+        already in memory. Appends are chained so records keep their order.
+        """
+        if self._history_file is None:
             display_name = (
                 "group_chat"
                 if self.group_id == "AI产品群"  # skip-i18n-check
                 else self.group_id
             )
             timestamp = get_now_with_timezone().strftime("%Y-%m-%d_%H-%M")
-            filename = f"{display_name}_{timestamp}.json"
-            filepath = self.config.chat_history_dir / filename
-
-            data = {
-                "group_id": self.group_id,
-                "last_updated": get_now_with_timezone().isoformat(),
-                "conversation_history": [
-                    {
-                        "timestamp": get_now_with_timezone().isoformat(),
-                        "user_input": user_q,
-                        "assistant_response": assistant_a,
-                    }
-                    for user_q, assistant_a in self.conversation_history
-                ],
-            }
-
-            with filepath.open("w", encoding="utf-8") as fp:
-                json.dump(data, fp, ensure_ascii=False, indent=2)
-
-            print(f"[{self.texts.get('save_label')}] {filename} ✅")
+            self._history_file = (
+                self.config.chat_history_dir / f"{display_name}_{timestamp}.jsonl"
+            )
+            records = [self._turn_record(q, a) for q, a in self.conversation_history]
+
+        filepath = self._history_file
+        payload = "".join(json_dumps(record) + "\n" for record in records)
+        if self._history_needs_newline:
+            payload = "\n" + payload
+            self._history_needs_newline = False
+        previous = self._save_task
+
+        async def _append() -> None:
+            if previous is not None:
+                await previous
+            try:
+                async with aiofiles.open(filepath, "a", encoding="utf-8") as f:
+                    await f.write(payload)
+            except Exception as e:
+                print(f"[{self.texts.get('warning_label')}] {e}")
+
+        self._save_task = asyncio.create_task(_append())
+
+    def schedule_history_save(self) -> None:
+        """Persist the latest turn in the background without blocking the chat"""
+        if not self.conversation_history:
+            return
+        self._schedule_append([self._turn_record(*self.conversation_history[-1])])
+
+    async def wait_for_pending_save(self) -> None:
+        """Wait for the background autosave (if any) to finish"""
+        if self._save_task is not None:
+            await self._save_task
+            self._save_task = None
+
+    async def save_conversation_history(self) -> None:
+        """Save conversation history to file
+
+        Turns are appended as they happen, so this only flushes pending
+        writes (creating the file if nothing was written yet).
+        """
+        try:
+            if self._history_file is None:
+                self._schedule_append([])
+            await self.wait_for_pending_save()
+
+            print(f"[{self.texts.get('save_label')}] {self._history_file.name} ✅")
 
         except Exception as e:
             print(f"[{self.texts.get('error_label')}] {e}")
 
     async def retrieve_memories(self, query: str) -> Dict[str, List[Dict[str, Any]]]:
-        """Retrieve memories (episodes, foresights, profile) in parallel."""
-        import asyncio
+        """Retrieve memories (episodes, foresights, profile) in parallel.
+
+        Queries nearly identical to an earlier one in this session reuse its
+        memories without calling the search API.
+        """
+        cached = self._retrieval_cache.get(query)
+        if cached is not None:
+            all_memories, metadata = cached
+            self.last_retrieval_metadata = {**metadata, "total_latency_ms": 0.0}
+            return all_memories
 
         tasks = [
             self._search(query, memory_types=["episodic_memory"]),
             self._search(query, memory_types=["foresight"]),
-            self._fetch_profile(),
+            self._get_profiles(),
         ]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -259,6 +436,12 @@ class ChatSession:
             "foresights_count": len(all_memories["foresights"]),
             "profiles_count": len(all_memories["profiles"]),
         }
+
+        # Only cache complete results; a failed search should be retried
+        if not any(isinstance(r, Exception) for r in results):
+            self._retrieval_cache.put(
+                query, (all_memories, self.last_retrieval_metadata)
+            )
         return all_memories
 
     # ==================== Unified Search API (aligned with test_v1api_search.py) ====================
@@ -289,7 +472,32 @@ class ChatSession:
         async with httpx.AsyncClient(timeout=timeout, verify=False) as client:
             response = await client.get(self.retrieve_url, params=params)
             response.raise_for_status()
-            return response.json()
+            return json_loads(response.content)
+
+    async def _get_profiles(self) -> List[Dict[str, Any]]:
+        """Profiles for this user, refetched at most once per `profile_cache_ttl_s`
+
+        Profiles change only when new memories are extracted, so consecutive
+        turns reuse the last fetch instead of calling the API every time.
+        """
+        if self._profile_cache is not None:
+            fetched_at, profiles = self._profile_cache
+            if time.monotonic() - fetched_at < self.config.profile_cache_ttl_s:
+                return profiles
+
+        profiles = await self._fetch_profile()
+        self._profile_cache = (time.monotonic(), profiles)
+        return profiles
+
+    async def _prefetch_profiles(self) -> None:
+        """Fill the profile cache ahead of the next turn
+
+        Failures are ignored; the turn then fetches (and reports) as usual.
+        """
+        try:
+            await self._get_profiles()
+        except Exception:
+            self._profile_cache = None
 
     async def _fetch_profile(self) -> List[Dict[str, Any]]:
         """Fetch profile via GET /api/v1/memories."""
@@ -299,7 +507,7 @@ class ChatSession:
         async with httpx.AsyncClient(timeout=30.0, verify=False) as client:
             response = await client.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
 
         if data.get("status") != "ok":
             raise RuntimeError(f"API Error: {data.get('message')}")
@@ -312,10 +520,18 @@ class ChatSession:
                 "readable_profile" not in profile_data
                 and "explicit_info" in profile_data
             ):
-
-                profile_data["readable_profile"] = ProfileMemoryLife.from_dict(
-                    profile_data
-                ).to_readable_profile()
+                content_hash = _profile_content_hash(profile_data)
+                readable = self._readable_profile_cache.get(content_hash)
+                if readable is None:
+                    from memory_layer.memory_extractor.profile_memory_life.types import (
+                        ProfileMemoryLife,
+                    )
+
+                    readable = ProfileMemoryLife.from_dict(
+                        profile_data
+                    ).to_readable_profile()
+                    self._readable_profile_cache[content_hash] = readable
+                profile_data["readable_profile"] = readable
                 mem["profile_data"] = profile_data
         return memories
 
@@ -356,15 +572,8 @@ class ChatSession:
             if not isinstance(grp, dict):
                 continue
             for gid, mlist in grp.items():
-                if not isinstance(mlist, list):
-                    continue
-                gscores = score_map.get(gid, [])
-                for i, m in enumerate(mlist):
-                    if isinstance(m, dict):
-                        item = dict(m)
-                        if "score" not in item and i < len(gscores):
-                            item["score"] = gscores[i]
-                        flat.append(item)
+                if isinstance(mlist, list):
+                    flat.extend(_memories_with_scores(mlist, score_map.get(gid, ())))
         return flat
 
     def build_prompt(
@@ -382,9 +591,7 @@ class ChatSession:
         messages = []
 
         # System Message
-        lang_key = "zh" if self.texts.language == "zh" else "en"
-        system_content = self.texts.get(f"prompt_system_role_{lang_key}")
-        messages.append({"role": "system", "content": system_content})
+        messages.append({"role": "system", "content": self._system_prompt})
 
         # Build memory context
         memory_sections: List[str] = []
@@ -434,9 +641,7 @@ class ChatSession:
         if memory_sections:
             messages.append({"role": "system", "content": "\n\n".join(memory_sections)})
         # Conversation History
-        for user_q, assistant_a in self.conversation_history[
-            -self.config.conversation_history_size :
-        ]:
+        for user_q, assistant_a in self.conversation_history:
             messages.append({"role": "user", "content": user_q})
             messages.append({"role": "assistant", "content": assistant_a})
 
@@ -453,10 +658,10 @@ class ChatSession:
         Returns:
             Assistant response
         """
-        from .ui import ChatUI
-
-        # Retrieve Memories
-        memories = await self.retrieve_memories(user_input)
+        # Retrieve Memories while the previous turn's autosave finishes
+        memories, _ = await asyncio.gather(
+            self.retrieve_memories(user_input), self.wait_for_pending_save()
+        )
 
         # Show Retrieval Results
         if self.config.show_retrieved_memories and memories:
@@ -475,37 +680,36 @@ class ChatSession:
         ChatUI.print_generating_indicator(self.texts)
 
         # Call LLM
+        self.last_response_streamed = False
+        answer_stream = AnswerStream()
         try:
-            if hasattr(self.llm_provider, 'provider') and hasattr(
-                self.llm_provider.provider, 'chat_with_messages'
-            ):
-                raw_response = await self.llm_provider.provider.chat_with_messages(
-                    messages
-                )
-            else:
-                prompt_parts = []
-                for msg in messages:
-                    role = msg["role"]
-                    content = msg["content"]
-                    if role == "system":
-                        prompt_parts.append(f"System: {content}")
-                    elif role == "user":
-                        prompt_parts.append(f"User: {content}")
-                    elif role == "assistant":
-                        prompt_parts.append(f"Assistant: {content}")
-
-                prompt = "\n\n".join(prompt_parts)
-                raw_response = await self.llm_provider.generate(prompt)
-
-            raw_response = raw_response.strip()
+            # Show the answer as it is generated instead of after the whole
+            # response has arrived
+            chunks = []
+            async for chunk in self.llm_provider.stream_with_messages(messages):
+                chunks.append(chunk)
+                answer_text = answer_stream.feed(chunk)
+                if answer_text:
+                    if not self.last_response_streamed:
+                        ChatUI.print_stream_start(self.texts)
+                        self.last_response_streamed = True
+                    ChatUI.print_stream_chunk(answer_text)
+            raw_response = "".join(chunks).strip()
 
             # Clear Generation Progress
-            ChatUI.print_generation_complete(self.texts)
+            if self.last_response_streamed:
+                ChatUI.print_stream_end()
+            else:
+                ChatUI.print_generation_complete(self.texts)
 
             assistant_response = raw_response
 
         except Exception as e:
-            ChatUI.clear_progress_indicator()
+            if self.last_response_streamed:
+                ChatUI.print_stream_end()
+                self.last_response_streamed = False
+            else:
+                ChatUI.clear_progress_indicator()
             error_msg = f"[{self.texts.get('error_label')}] {self.texts.get('chat_llm_error', error=str(e))}"
             print(f"\n{error_msg}")
             import traceback
@@ -513,28 +717,28 @@ class ChatSession:
             traceback.print_exc()
             return error_msg
 
-        # Update Conversation History
-        self.conversation_history.append((user_input, assistant_response))
-
-        if len(self.conversation_history) > self.config.conversation_history_size:
-            self.conversation_history = self.conversation_history[
-                -self.config.conversation_history_size :
-            ]
-
+        self._remember_turn(user_input, assistant_response)
+        self.schedule_history_save()
         return assistant_response
 
+    def _remember_turn(self, user_input: str, assistant_response: str) -> None:
+        """Append a turn to the bounded conversation history"""
+        self.conversation_history.append((user_input, assistant_response))
+
     def clear_history(self) -> None:
         """Clear conversation history"""
-        from .ui import ChatUI
-
         count = len(self.conversation_history)
-        self.conversation_history = []
+        self.conversation_history.clear()
+        if self._history_file is not None:
+            # Later loads stop reading at the marker
+            self._schedule_append(
+                [{"timestamp": get_now_with_timezone().isoformat(), "cleared": True}]
+            )
         ChatUI.print_info(self.texts.get("cmd_clear_done", count=count), self.texts)
 
     async def reload_data(self) -> None:
         """Reload memory data"""
-        from .ui import ChatUI
-        from common_utils.cli_ui import CLIUI
+        from demo.utils import count_memcells_by_group_and_time
 
         display_name = (
             "group_chat"
@@ -542,17 +746,21 @@ class ChatSession:
             else self.group_id
         )
 
-        ui = CLIUI()
+        ui = ChatUI._ui()
         print()
         ui.note(self.texts.get("cmd_reload_refreshing", name=display_name), icon="🔄")
 
-        # Recount MemCells
+        # Memories may have changed: cached retrievals are stale
+        self._retrieval_cache.clear()
+        self._profile_cache = None
+
+        # Recount MemCells and refetch the profile
         now = get_now_with_timezone()
         start_date = now - timedelta(days=self.config.time_range_days)
-        memcells = await query_memcells_by_group_and_time(
-            self.group_id, start_date, now
+        self.memcell_count, _ = await asyncio.gather(
+            count_memcells_by_group_and_time(self.group_id, start_date, now),
+            self._prefetch_profiles(),
         )
-        self.memcell_count = len(memcells)
 
         print()
         ui.success(
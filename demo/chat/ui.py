@@ -3,11 +3,313 @@
 Provides beautiful terminal output formatting.
 """
 
+import asyncio
+import concurrent.futures
+import os
 import re
-from typing import List, Dict, Any, Optional
+import signal
+import sys
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, List, Dict, Any, Optional, Tuple
 
 from demo.ui import I18nTexts
-from common_utils.cli_ui import CLIUI
+from demo.utils.json_utils import json_loads
+from common_utils.cli_ui import CLIUI, get_terminal_width
+
+# Rendered static menu blocks keyed by (menu name, language)
+_MENU_CACHE: Dict[Tuple[str, str], str] = {}
+
+# Erase the current line, then move up and erase twice (blank line + indicator)
+_CLEAR_INDICATOR = "\r\033[K\033[A\033[K\033[A\033[K"
+
+# Metadata label for each answer confidence level, keyed by the raw value
+_CONFIDENCE_LABELS = {
+    level: f"{icon} {level}"
+    for level, icon in (("high", "✓"), ("medium", "~"), ("low", "?"))
+}
+
+# CLIUI shared by all ChatUI output, see ChatUI._ui()
+_shared_ui: Optional[CLIUI] = None
+
+# Line read abandoned by Ctrl+C; the next ainput() call picks it up
+_pending_line: Optional[concurrent.futures.Future] = None
+
+
+def _read_stdin_line() -> str:
+    """Read one line from a non-terminal stdin without Python's buffer lock
+
+    `input()` on a pipe reads through `sys.stdin`'s buffered reader and holds
+    its lock while blocked; a read abandoned by Ctrl+C would then abort
+    interpreter shutdown. Reading the file descriptor directly holds no lock.
+    """
+    fd = sys.stdin.fileno()
+    data = bytearray()
+    while True:
+        byte = os.read(fd, 1)
+        if not byte:
+            if not data:
+                raise EOFError
+            break
+        if byte == b"\n":
+            break
+        data += byte
+    encoding = getattr(sys.stdin, "encoding", None) or "utf-8"
+    return data.decode(encoding, errors="replace").rstrip("\r")
+
+
+def _read_line(prompt: str, future: concurrent.futures.Future) -> None:
+    try:
+        if sys.stdin.isatty():
+            line = input(prompt)
+        else:
+            print(prompt, end="", flush=True)
+            line = _read_stdin_line()
+        future.set_result(line)
+    except BaseException as e:
+        future.set_exception(e)
+
+
+async def ainput(prompt: str = "") -> str:
+    """Read a line from stdin without blocking the event loop
+
+    The line is read on a daemon thread, so background tasks keep progressing
+    while the user types. While waiting, SIGINT is handled by the event loop:
+    Ctrl+C raises KeyboardInterrupt here, just like `input()`, and the read
+    keeps running for the next call.
+
+    Args:
+        prompt: Prompt text
+
+    Returns:
+        Input line (without trailing newline)
+    """
+    global _pending_line
+
+    future = _pending_line
+    if future is None:
+        future = concurrent.futures.Future()
+        threading.Thread(target=_read_line, args=(prompt, future), daemon=True).start()
+        _pending_line = future
+    else:
+        # Reuse the reader still waiting on stdin instead of starting a second one
+        print(prompt, end="", flush=True)
+
+    loop = asyncio.get_running_loop()
+    line = asyncio.wrap_future(future)
+    interrupted = loop.create_future()
+    previous_handler = signal.getsignal(signal.SIGINT)
+    try:
+        loop.add_signal_handler(
+            signal.SIGINT, lambda: interrupted.done() or interrupted.set_result(None)
+        )
+        handles_sigint = True
+    except (NotImplementedError, RuntimeError, ValueError):
+        # No loop signal support (e.g. Windows): Ctrl+C reaches asyncio.run
+        handles_sigint = False
+
+    try:
+        # wait() never cancels `line`, so the read survives an interrupt
+        await asyncio.wait({line, interrupted}, return_when=asyncio.FIRST_COMPLETED)
+        if line.done():
+            return line.result()
+        raise KeyboardInterrupt
+    finally:
+        if handles_sigint:
+            loop.remove_signal_handler(signal.SIGINT)
+            if previous_handler is not None:
+                signal.signal(signal.SIGINT, previous_handler)
+        if future.done():
+            _pending_line = None
+
+
+def save_terminal_mode() -> Optional[list]:
+    """Return the termios attributes of the stdin terminal
+
+    Returns:
+        Attributes for `restore_terminal_mode`, or None when stdin is not a
+        terminal (or termios is unavailable)
+    """
+    try:
+        import termios
+
+        return termios.tcgetattr(sys.stdin.fileno())
+    except Exception:
+        return None
+
+
+def restore_terminal_mode(mode: Optional[list]) -> None:
+    """Restore terminal attributes saved by `save_terminal_mode`
+
+    A read abandoned by Ctrl+C can still be inside readline, which switches
+    the terminal out of echo/canonical mode, when the app exits.
+    """
+    if mode is None:
+        return
+    try:
+        import termios
+
+        termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, mode)
+    except Exception:
+        pass
+
+
+# A whole response wrapped in a Markdown code fence (```json ... ```)
+_CODE_FENCE_RE = re.compile(r"^\s*```[\w-]*[ \t]*\n?(.*?)\s*```\s*$", re.DOTALL)
+
+
+@dataclass(slots=True)
+class StructuredResponse:
+    """Structured assistant answer parsed from the LLM's JSON output"""
+
+    answer: str = ""
+    reasoning: str = ""
+    references: List[str] = field(default_factory=list)
+    confidence: str = ""
+    additional_notes: str = ""
+
+    @classmethod
+    def from_json(cls, raw: str) -> Optional["StructuredResponse"]:
+        """Parse a JSON response
+
+        Args:
+            raw: Raw LLM response text
+
+        Returns:
+            StructuredResponse, or None if the text is not a JSON object
+        """
+        fenced = _CODE_FENCE_RE.match(raw)
+        if fenced:
+            raw = fenced.group(1)
+        # Plain-text answers are rejected without attempting a parse
+        if not raw.lstrip().startswith("{"):
+            return None
+        try:
+            data = json_loads(raw)
+        except ValueError:
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        # Coerce to the declared field types so rendering never sees
+        # unexpected values (null, numbers, a bare string for references)
+        references = data.get("references") or []
+        if not isinstance(references, list):
+            references = [references]
+        return cls(
+            answer=_as_text(data.get("answer")),
+            reasoning=_as_text(data.get("reasoning")),
+            references=[_as_text(ref) for ref in references if ref is not None],
+            confidence=_as_text(data.get("confidence")),
+            additional_notes=_as_text(data.get("additional_notes")),
+        )
+
+
+def _as_text(value: Any) -> str:
+    """String form of a JSON field value (None becomes "")"""
+    if value is None:
+        return ""
+    return value if isinstance(value, str) else str(value)
+
+
+# Memory fields shown in the retrieval list, in priority order
+_MEMORY_DISPLAY_FIELDS = (
+    "subject", "summary", "episode", "foresight", "atomic_fact", "content"
+)
+
+
+def _memory_line(index: int, mem: Dict[str, Any]) -> str:
+    """One row of the retrieved-memory panel"""
+    # Actual event time (not storage time)
+    event_time = extract_event_time_from_memory(mem)
+    
+    # First non-empty field; stop at the first hit instead of stripping all
+    display_text = "(No Content)"
+    for field_name in _MEMORY_DISPLAY_FIELDS:
+        value = (mem.get(field_name) or "").strip()
+        if value:
+            display_text = value if len(value) <= 80 else value[:77] + "..."
+            break
+    
+    score = mem.get("score")
+    score_text = f"{score:.3f} | " if isinstance(score, (int, float)) else ""
+    if event_time:
+        return f"📌 [{index}]  {event_time}  │  {score_text}{display_text}"
+    return f"📌 [{index}]  {score_text}{display_text}"
+
+
+_ANSWER_START_RE = re.compile(r'"answer"\s*:\s*"')
+_JSON_ESCAPES = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class AnswerStream:
+    """Incrementally extracts the "answer" string from streamed JSON output
+
+    The chat prompt asks for a JSON object, so raw deltas are not fit for
+    display. Each `feed()` returns only the newly decoded part of the
+    "answer" value; output that never contains it yields nothing.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._in_answer = False
+        self._done = False
+        self._escape: Optional[str] = None
+        self._high_surrogate: Optional[int] = None
+
+    @property
+    def started(self) -> bool:
+        """Whether any part of the answer has been located"""
+        return self._in_answer or self._done
+
+    def feed(self, chunk: str) -> str:
+        """Consume a streamed delta and return newly available answer text"""
+        if self._done:
+            return ""
+        if not self._in_answer:
+            self._buffer += chunk
+            match = _ANSWER_START_RE.search(self._buffer)
+            if match is None:
+                return ""
+            chunk = self._buffer[match.end():]
+            self._buffer = ""
+            self._in_answer = True
+
+        out = []
+        for ch in chunk:
+            if self._escape is not None:
+                self._escape += ch
+                if self._escape[0] == "u":
+                    if len(self._escape) < 5:
+                        continue
+                    out.append(self._decode_unicode(self._escape[1:]))
+                else:
+                    out.append(_JSON_ESCAPES.get(ch, ch))
+                self._escape = None
+            elif ch == "\\":
+                self._escape = ""
+            elif ch == '"':
+                self._in_answer = False
+                self._done = True
+                break
+            else:
+                out.append(ch)
+        return "".join(out)
+
+    def _decode_unicode(self, hex_digits: str) -> str:
+        try:
+            code = int(hex_digits, 16)
+        except ValueError:
+            return ""
+        if 0xD800 <= code < 0xDC00:
+            self._high_surrogate = code
+            return ""
+        if 0xDC00 <= code < 0xE000:
+            if self._high_surrogate is None:
+                return ""
+            code = 0x10000 + ((self._high_surrogate - 0xD800) << 10) + (code - 0xDC00)
+        self._high_surrogate = None
+        return chr(code)
 
 
 def extract_event_time_from_memory(mem: Dict[str, Any]) -> Optional[str]:
@@ -91,14 +393,34 @@ class ChatUI:
     
     @staticmethod
     def _ui() -> CLIUI:
-        """Get UI instance"""
-        return CLIUI()
+        """Get the shared UI instance (rebuilt only when the terminal is resized)"""
+        global _shared_ui
+        width = get_terminal_width()
+        if _shared_ui is None or _shared_ui.term_width != width:
+            _shared_ui = CLIUI(width=width)
+        return _shared_ui
+    
+    @staticmethod
+    def print_menu(
+        name: str, texts: I18nTexts, build_lines: Callable[[], List[str]]
+    ) -> None:
+        """Print a static menu block, rendered once per language
+        
+        Args:
+            name: Menu identifier
+            texts: I18nTexts object
+            build_lines: Returns the menu lines (only called on first use)
+        """
+        key = (name, texts.language)
+        menu = _MENU_CACHE.get(key)
+        if menu is None:
+            menu = _MENU_CACHE[key] = "".join(f"{line}\n" for line in build_lines())
+        sys.stdout.write(menu)
     
     @staticmethod
     def clear_screen():
         """Clear screen"""
-        print("\033[2J\033[H", end="")
-        import sys
+        sys.stdout.write("\033[2J\033[H")
         sys.stdout.flush()
     
     @staticmethod
@@ -116,14 +438,17 @@ class ChatUI:
         print()
         ui.section_heading(texts.get("groups_available_title"))
         
+        suffix = "memories" if texts.language == "en" else "条记忆"
         rows = []
         for group in groups:
-            index = group["index"]
             group_id = group["group_id"]
             name = group.get("name", group_id)
-            count = group["memcell_count"]
-            count_text = f"💾 {count} " + ("memories" if texts.language == "en" else "条记忆")
-            rows.append([f"[{index}]", group_id, f'📝 "{name}"', count_text])
+            rows.append([
+                f"[{group['index']}]",
+                group_id,
+                f'📝 "{name}"',
+                f"💾 {group['memcell_count']} {suffix}",
+            ])
         
         headers = [
             texts.get("table_header_index"),
@@ -225,108 +550,97 @@ class ChatUI:
                             print(f"      {i}. {q[:60]}{'...' if len(q) > 60 else ''}")
         
         # Display Memory List
-        lines = []
-        for i, mem in enumerate(memories, start=1):
-            # Extract actual event time (not storage time)
-            event_time = extract_event_time_from_memory(mem)
-            
-            # Priority: subject > summary > episode > atomic_fact > content
-            # Use strip() to ensure empty strings are handled correctly
-            subject = (mem.get("subject") or "").strip()
-            summary = (mem.get("summary") or "").strip()
-            episode = (mem.get("episode") or "").strip()
-            foresight = (mem.get("foresight") or "").strip()  # Foresight content field
-            atomic_fact = (mem.get("atomic_fact") or "").strip()
-            content = (mem.get("content") or "").strip()
-            
-            # Select first non-empty field
-            display_text = subject or summary or episode or foresight or atomic_fact or content or "(No Content)"
-            
-            # Limit display length
-            if len(display_text) > 80:
-                display_text = display_text[:77] + "..."
-            
-            # Build display line: show time if available, otherwise omit
-            score = mem.get("score")
-            score_text = ""
-            if isinstance(score, (int, float)):
-                score_text = f"{score:.3f} | "
-            if event_time:
-                lines.append(f"📌 [{i}]  {event_time}  │  {score_text}{display_text}")
-            else:
-                lines.append(f"📌 [{i}]  {score_text}{display_text}")
+        lines = [_memory_line(i, mem) for i, mem in enumerate(memories, start=1)]
         
         if lines:
-            print()
+            sys.stdout.write("\n")
             ui.panel(lines)
     
     @staticmethod
     def print_generating_indicator(texts: I18nTexts):
         """Display generation progress indicator"""
         ui = ChatUI._ui()
-        print()
+        sys.stdout.write("\n")
         ui.note(f"🤔 {texts.get('chat_generating')}", icon="⏳")
     
     @staticmethod
     def print_generation_complete(texts: I18nTexts):
         """Clear generation indicator and show completion mark"""
-        print("\r\033[K", end="")
-        print("\033[A\033[K", end="")
-        print("\033[A\033[K", end="")
+        ChatUI.clear_progress_indicator()
         ui = ChatUI._ui()
         ui.success(f"✓ {texts.get('chat_generation_complete')}")
     
     @staticmethod
     def clear_progress_indicator():
         """Clear progress indicator"""
-        print("\r\033[K", end="")
-        print("\033[A\033[K", end="")
-        print("\033[A\033[K", end="")
+        sys.stdout.write(_CLEAR_INDICATOR)
+    
+    @staticmethod
+    def print_stream_start(texts: I18nTexts):
+        """Replace the generation indicator with the streamed answer heading"""
+        ChatUI.clear_progress_indicator()
+        ui = ChatUI._ui()
+        ui.text(f"🤖 {texts.get('response_assistant_title')}")
+        sys.stdout.write("\n")
+    
+    @staticmethod
+    def print_stream_chunk(text: str):
+        """Write a piece of the streamed answer without a line break"""
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    
+    @staticmethod
+    def print_stream_end():
+        """Terminate the streamed answer line"""
+        sys.stdout.write("\n")
     
     @staticmethod
-    def print_assistant_response(response: str, texts: I18nTexts):
+    def print_assistant_response(response: str, texts: I18nTexts, streamed: bool = False):
         """Display Assistant Response
         
         Optimized display:
         - Mainly show 'answer' (Large Title)
         - 'references' and 'confidence' as metadata (Small text)
         - Hide 'reasoning'
+        
+        Args:
+            response: Raw assistant response
+            texts: I18nTexts object
+            streamed: The answer was already printed while streaming, so only
+                the metadata is shown
         """
         ui = ChatUI._ui()
-        print()
+        sys.stdout.write("\n")
         
         # Try parsing JSON response
-        try:
-            import json
-            data = json.loads(response)
-            
-            # Extract fields
-            answer = data.get("answer", "")
-            references = data.get("references", [])
-            confidence = data.get("confidence", "")
-            
+        structured = StructuredResponse.from_json(response)
+        if structured is not None:
             # Display main answer (Large Title)
-            ui.panel([answer], title=f"🤖 {texts.get('response_assistant_title')}")
+            if not streamed:
+                ui.panel([structured.answer], title=f"🤖 {texts.get('response_assistant_title')}")
             
             # Display metadata (Small text, dimmed)
             metadata_parts = []
-            if references:
-                ref_text = ", ".join(references)
+            if structured.references:
+                ref_text = ", ".join(structured.references)
                 metadata_parts.append(f"📚 {ref_text}")
-            if confidence:
-                confidence_icon = {"high": "✓", "medium": "~", "low": "?"}.get(confidence, "")
-                metadata_parts.append(f"{confidence_icon} {confidence}")
+            if structured.confidence:
+                metadata_parts.append(
+                    _CONFIDENCE_LABELS.get(structured.confidence)
+                    or f" {structured.confidence}"
+                )
             
             if metadata_parts:
                 metadata_line = "  │  ".join(metadata_parts)
-                print(f"  {metadata_line}")
-            
-        except (json.JSONDecodeError, ValueError):
-            # If not JSON format, display raw response directly
+                sys.stdout.write(f"  {metadata_line}\n")
+        elif not streamed:
+            # If not JSON format, display raw response directly; a streamed
+            # answer is already on screen and is not repeated
             ui.panel([response], title=f"🤖 {texts.get('response_assistant_title')}")
         
         ui.rule()
-        print()
+        sys.stdout.write("\n")
+        sys.stdout.flush()
     
     @staticmethod
     def print_help(texts: I18nTexts):
@@ -11,19 +11,37 @@ Alternative:
 import asyncio
 from pathlib import Path
 
-from dotenv import load_dotenv
 from demo.chat import ChatOrchestrator
-
-load_dotenv()
+from demo.chat.ui import restore_terminal_mode, save_terminal_mode
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
 
 async def main():
     """Main Entry - Start Chat Application"""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
     orchestrator = ChatOrchestrator(PROJECT_ROOT)
     await orchestrator.run()
 
 
+def _event_loop_factory():
+    """uvloop's loop factory when installed (via uvicorn[standard]), else None"""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    terminal_mode = save_terminal_mode()
+    try:
+        asyncio.run(main(), loop_factory=_event_loop_factory())
+    except KeyboardInterrupt:
+        # Ctrl+C outside a prompt cancels the main task; exit quietly
+        print()
+    finally:
+        restore_terminal_mode(terminal_mode)
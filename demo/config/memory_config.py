@@ -101,6 +101,9 @@ class ChatModeConfig:
     conversation_history_size: int = 10
     time_range_days: int = 365
     show_retrieved_memories: bool = True
+    retrieval_cache_size: int = 64  # Near-duplicate queries reuse retrieved memories; 0 disables
+    retrieval_cache_similarity: float = 0.88  # Query similarity (0-1] that counts as a cache hit
+    profile_cache_ttl_s: float = 60.0  # Seconds a fetched user profile is reused; 0 disables
     
     # Paths (automatically set)
     chat_history_dir: Path = field(default_factory=lambda: Path(__file__).parent.parent / "chat_history")
@@ -1,10 +1,14 @@
 import asyncio
-import json
 from pathlib import Path
 from datetime import datetime, timezone
 import httpx
+from tqdm import tqdm
 from demo.tools.clear_all_data import clear_all_memories
 from common_utils.language_utils import get_prompt_language
+from demo.utils.json_utils import json_dumps, json_loads
+
+# Default headers of the client shared by every POST to the API
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 def load_conversation_data(file_path: str) -> tuple:
@@ -17,8 +21,8 @@ def load_conversation_data(file_path: str) -> tuple:
     if not data_file.exists():
         raise FileNotFoundError(f"Data file not found: {file_path}")
 
-    with open(data_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    # orjson-backed parse straight from bytes (no text decode pass)
+    data = json_loads(data_file.read_bytes())
 
     # Extract message list and metadata
     messages = data.get('conversation_list', [])
@@ -65,18 +69,16 @@ async def upsert_conversation_meta(
             else None
         ) or datetime.now(timezone.utc).isoformat()
 
-    user_details = conversation_meta.get("user_details") or {}
-    if not user_details:
-        # Fallback: derive minimal user_details from message senders
-        for m in messages:
-            sender = m.get("sender")
-            if not sender:
-                continue
-            user_details[sender] = {
-                "full_name": m.get("sender_name") or sender,
-                "role": "user",
-                "extra": {},
-            }
+    # Fallback: derive minimal user_details from message senders
+    user_details = conversation_meta.get("user_details") or {
+        sender: {
+            "full_name": m.get("sender_name") or sender,
+            "role": "user",
+            "extra": {},
+        }
+        for m in messages
+        if (sender := m.get("sender"))
+    }
 
     payload = {
         "version": conversation_meta.get("version", "1.0"),
@@ -92,14 +94,12 @@ async def upsert_conversation_meta(
     }
 
     url = f"{base_url}/api/v1/memories/conversation-meta"
-    resp = await client.post(
-        url, json=payload, headers={"Content-Type": "application/json"}
-    )
+    resp = await client.post(url, content=json_dumps(payload).encode("utf-8"))
     if resp.status_code != 200:
         print(f"⚠️  Failed to save conversation-meta: HTTP {resp.status_code}")
         print(resp.text[:300])
     else:
-        result = resp.json().get("result", {})
+        result = json_loads(resp.content).get("result", {})
         print(
             f"✓ conversation-meta saved: group_id={result.get('group_id')}, scene={result.get('scene')}"
         )
@@ -136,6 +136,64 @@ def prompt_clear_data() -> bool:
             print("Please enter Y (yes) or N (no)")
 
 
+async def post_message(
+    client: httpx.AsyncClient,
+    memorize_url: str,
+    message: dict,
+    base_url: str,
+    label: str,
+) -> str | None:
+    """Send one message to the memorize API
+
+    Successful sends are only counted by the caller's progress bar; the
+    message label is printed together with the details when a send fails.
+
+    Returns:
+        "accumulated", "processing", or "skipped" (failed or timed out);
+        None if sending should stop
+    """
+    try:
+        response = await client.post(
+            memorize_url,
+            content=json_dumps(message).encode("utf-8"),
+        )
+
+        if response.status_code == 200:
+            result = json_loads(response.content).get("result", {})
+            if result.get("status_info", "unknown") == "processing":
+                return "processing"
+            # "accumulated", or old versions / other statuses
+            return "accumulated"
+        elif response.status_code == 202:
+            return "processing"
+        else:
+            tqdm.write(
+                f"{label}\n   ✗ Failed: HTTP {response.status_code}"
+                f"\n      {response.text[:200]}"
+            )
+            return "skipped"
+
+    except httpx.ConnectError:
+        tqdm.write(
+            f"{label}\n   ✗ Connection failed: Unable to connect to {base_url}"
+            "\n      Ensure V1 API service is running:"
+            "\n      uv run python src/bootstrap.py src/run.py"
+        )
+        return None
+    except httpx.ReadTimeout:
+        tqdm.write(
+            f"{label}\n   ⚠ Timeout: Processing exceeded 500s"
+            "\n      Skipping message and continuing..."
+        )
+        return "skipped"  # Skip timeout message and continue
+    except Exception as e:
+        tqdm.write(f"{label}\n   ✗ Error: {type(e).__name__}: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return None
+
+
 async def test_memorize_api():
     """Test V1 API /memories endpoint (single message storage)"""
 
@@ -190,10 +248,9 @@ async def test_memorize_api():
     print("   • '🔄 Processing' = Boundary detected, submitted to background worker")
     print()
 
-    total_accumulated = 0
-    total_processing = 0
+    totals = {"accumulated": 0, "processing": 0}
 
-    async with httpx.AsyncClient(timeout=500.0) as client:
+    async with httpx.AsyncClient(timeout=500.0, headers=_JSON_HEADERS) as client:
         # Save conversation-meta first (scene is read from MongoDB during extraction)
         await upsert_conversation_meta(
             client=client,
@@ -205,58 +262,37 @@ async def test_memorize_api():
             group_name=group_name,
         )
 
-        for idx, message in enumerate(test_messages, 1):
-            print(
-                f"[{idx}/{len(test_messages)}] {message['sender']}: {message['content'][:40]}..."
-            )
-
-            try:
-                response = await client.post(
+        total = len(test_messages)
+        # One progress line for the whole run; per-message output only on failure
+        pbar = tqdm(total=total, desc="📤 Memorize Progress", unit="msg")
+
+        # The server detects conversation boundaries from arrival order, so
+        # messages are sent strictly one after another
+        try:
+            for idx, message in enumerate(test_messages, 1):
+                sender = message["sender"]
+                preview = message["content"][:40]
+                status = await post_message(
+                    client,
                     memorize_url,
-                    json=message,
-                    headers={"Content-Type": "application/json"},
+                    message,
+                    base_url,
+                    label=f"[{idx}/{total}] {sender}: {preview}...",
                 )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    saved_count = result.get("result", {}).get("count", 0)
-                    status_info = result.get("result", {}).get("status_info", "unknown")
-
-                    if status_info == "accumulated":
-                        total_accumulated += 1
-                        print(f"   ⏳ Queued")
-                    elif status_info == "processing":
-                        total_processing += 1
-                        request_id = result.get("result", {}).get("request_id", "")
-                        print(f"   🔄 Processing (request_id: {request_id[:8]}...)")
-                    else:
-                        # Compatible with old versions or other statuses
-                        total_accumulated += 1
-                        print(f"   ⏳ Queued")
-                elif response.status_code == 202:
-                    result = response.json()
-                    total_processing += 1
-                    request_id = result.get("request_id", "")
-                    print(f"   🔄 Processing (request_id: {request_id[:8]})")
-                else:
-                    print(f"   ✗ Failed: HTTP {response.status_code}")
-                    print(f"      {response.text[:200]}")
-
-            except httpx.ConnectError:
-                print(f"   ✗ Connection failed: Unable to connect to {base_url}")
-                print(f"      Ensure V1 API service is running:")
-                print(f"      uv run python src/bootstrap.py src/run.py")
-                return False
-            except httpx.ReadTimeout:
-                print(f"   ⚠ Timeout: Processing exceeded 500s")
-                print(f"      Skipping message and continuing...")
-                continue  # Skip timeout message and continue
-            except Exception as e:
-                print(f"   ✗ Error: {type(e).__name__}: {e}")
-                import traceback
-
-                traceback.print_exc()
-                return False
+                if status is None:
+                    return False
+                if status in totals:
+                    totals[status] += 1
+                # tqdm throttles redraws; only refresh the counts shown in the
+                # postfix when the bar was actually drawn
+                if pbar.update(1):
+                    pbar.set_postfix(totals, refresh=False)
+        finally:
+            pbar.set_postfix(totals, refresh=False)
+            pbar.close()
+
+    total_accumulated = totals["accumulated"]
+    total_processing = totals["processing"]
 
     print("\n" + "=" * 100)
     print("✓ Test completed successfully")
@@ -20,6 +20,7 @@ from typing import List, Dict, Any
 from common_utils.datetime_utils import get_now_with_timezone
 import time
 from common_utils.language_utils import get_prompt_language
+from demo.utils.json_utils import json_loads
 
 
 def get_test_query() -> str:
@@ -88,7 +89,7 @@ class RetrievalTester:
         self.total_tests += 1
 
         # Record single request start time
-        request_start_time = time.time()
+        request_start_time = time.perf_counter()
 
         # Build request payload
         # Map data_source to memory_types API format
@@ -116,11 +117,11 @@ class RetrievalTester:
             async with httpx.AsyncClient(timeout=30.0) as client:
                 response = await client.get(self.retrieve_url, params=payload)
                 response.raise_for_status()
-                result = response.json()
+                result = json_loads(response.content)
 
                 # Calculate single request elapsed time
                 request_elapsed = (
-                    time.time() - request_start_time
+                    time.perf_counter() - request_start_time
                 ) * 1000  # Convert to ms
                 self.total_request_time += request_elapsed
 
@@ -267,7 +268,7 @@ class RetrievalTester:
         """
         # Record test start time
         if self.start_time is None:
-            self.start_time = time.time()
+            self.start_time = time.perf_counter()
 
         print("\n" + "=" * 80)
         print(f"🧪 Starting Comprehensive Retrieval Test")
@@ -337,7 +338,7 @@ class RetrievalTester:
         """Print Test Summary"""
         # Record test end time
         if self.end_time is None:
-            self.end_time = time.time()
+            self.end_time = time.perf_counter()
 
         total_elapsed = self.end_time - self.start_time if self.start_time else 0
 
@@ -502,7 +503,7 @@ async def main():
     """Main Test Function"""
 
     # Record overall test start time
-    overall_start_time = time.time()
+    overall_start_time = time.perf_counter()
 
     print("=" * 80)
     print("🧪 Comprehensive Memory Retrieval Test")
@@ -533,7 +534,7 @@ async def main():
     print("\n" + "🔬" * 40)
     print("Test Scenario 1: Personal Memory Query")
     print("🔬" * 40)
-    test1_start = time.time()
+    test1_start = time.perf_counter()
 
     await tester.run_comprehensive_test(
         query=test_query,
@@ -546,14 +547,14 @@ async def main():
         },
         profile_group_id="chat_user_001_assistant",
     )
-    test1_elapsed = time.time() - test1_start
+    test1_elapsed = time.perf_counter() - test1_start
     print(f"\n⏱️  Scenario 1 Duration: {test1_elapsed:.2f}s")
 
     # ========== Test 2: Group Memory Query ==========
     print("\n" + "🔬" * 40)
     print("Test Scenario 2: Group Memory Query")
     print("🔬" * 40)
-    test2_start = time.time()
+    test2_start = time.perf_counter()
 
     await tester.run_comprehensive_test(
         query=test_query,
@@ -566,14 +567,14 @@ async def main():
         },
         profile_group_id="chat_user_001_assistant",
     )
-    test2_elapsed = time.time() - test2_start
+    test2_elapsed = time.perf_counter() - test2_start
     print(f"\n⏱️  Scenario 2 Duration: {test2_elapsed:.2f}s")
 
     # ========== Test 3: Foresight Specific Test (Validity Filtering) ==========
     print("\n" + "🔬" * 40)
     print("Test Scenario 3: Foresight Validity Filtering")
     print("🔬" * 40)
-    test3_start = time.time()
+    test3_start = time.perf_counter()
 
     # Test currently valid foresight
     print("\n  📅 Sub-test 3.1: Retrieve currently valid foresight")
@@ -612,7 +613,7 @@ async def main():
         allow_empty=True,
     )
 
-    test3_elapsed = time.time() - test3_start
+    test3_elapsed = time.perf_counter() - test3_start
 
     print(f"\n  📊 Time Filtering Comparison:")
     print(f"     Past (2024-01-01): {result_past.get('count', 0)} items")
@@ -626,7 +627,7 @@ async def main():
     tester.print_summary()
 
     # Overall Duration
-    overall_elapsed = time.time() - overall_start_time
+    overall_elapsed = time.perf_counter() - overall_start_time
     print(f"\n⏱️  Overall Test Duration: {overall_elapsed:.2f}s")
     print(
         f"   Scenario 1: {test1_elapsed:.2f}s ({test1_elapsed/overall_elapsed*100:.1f}%)"
@@ -683,7 +684,7 @@ async def demo_foresight_evidence():
         async with httpx.AsyncClient(timeout=30.0) as client:
             response = await client.get(retrieve_url, params=payload)
             response.raise_for_status()
-            result = response.json()
+            result = json_loads(response.content)
 
             if result.get("status") == "ok":
                 memories = result.get("result", {}).get("memories", [])
@@ -8,14 +8,17 @@ Usage:
     print(texts.get("banner_title"))
 """
 
-from typing import Dict, Any
+import functools
+import sys
+import types
+from typing import Dict, Mapping
 
 
 class I18nTexts:
     """Internationalization Text Manager"""
 
-    # Chinese-English mapping for all texts
-    TEXTS: Dict[str, Dict[str, str]] = {
+    # Chinese-English mapping for all texts (made read-only after the class body)
+    TEXTS: Mapping[str, Mapping[str, str]] = {
         # ==================== Language Selection ====================
         "language_selection_title": {
             "zh": "🌏  语言选择 / Language Selection",
@@ -332,9 +335,9 @@ class I18nTexts:
             "zh": "连接 MongoDB...",
             "en": "Connecting to MongoDB...",
         },
-        "mongodb_init_failed": {
-            "zh": "MongoDB 初始化失败: {error}",
-            "en": "MongoDB initialization failed: {error}",
+        "groups_load_failed": {
+            "zh": "无法从 MongoDB 加载群组: {error}",
+            "en": "Could not load groups from MongoDB: {error}",
         },
         # ==================== Table Headers ====================
         "table_header_index": {"zh": "#", "en": "#"},
@@ -563,6 +566,7 @@ Schema:
             language: Language code, "zh" or "en"
         """
         self.language = language if language in ["zh", "en"] else "zh"
+        self._texts = _flat_texts(self.language)
 
     def get(self, key: str, **kwargs) -> str:
         """Get text for specific key
@@ -574,18 +578,15 @@ Schema:
         Returns:
             Formatted text
         """
-        text_dict = self.TEXTS.get(key, {})
-        text = text_dict.get(self.language, text_dict.get("zh", key))
+        text = self._texts.get(key, key)
+        if not kwargs or "{" not in text:
+            return text
 
-        # If formatting parameters exist, format the text
-        if kwargs:
-            try:
-                text = text.format(**kwargs)
-            except KeyError:
-                # If formatting fails, return original text
-                pass
-
-        return text
+        try:
+            return text.format(**kwargs)
+        except KeyError:
+            # If formatting fails, return original text
+            return text
 
     def set_language(self, language: str) -> None:
         """Set language
@@ -595,3 +596,26 @@ Schema:
         """
         if language in ["zh", "en"]:
             self.language = language
+            self._texts = _flat_texts(language)
+
+
+# The texts are static: freeze them so they cannot be changed at runtime, which
+# would also leave the per-language caches below stale. Values are interned so
+# texts shared between keys or languages are stored once.
+I18nTexts.TEXTS = types.MappingProxyType(
+    {
+        key: types.MappingProxyType(
+            {lang: sys.intern(text) for lang, text in text_dict.items()}
+        )
+        for key, text_dict in I18nTexts.TEXTS.items()
+    }
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _flat_texts(language: str) -> Dict[str, str]:
+    """All texts resolved for a language (falling back to Chinese), by key"""
+    return {
+        key: text_dict.get(language, text_dict.get("zh", key))
+        for key, text_dict in I18nTexts.TEXTS.items()
+    }
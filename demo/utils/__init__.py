@@ -1,22 +1,42 @@
 """Utility Module
 
 Provides common utility functions and a simple memory manager.
+
+MongoDB/Beanie helpers are imported on first access: loading them pulls in
+pymongo, beanie and the document models, which CLI menus do not need.
 """
 
-from demo.utils.memory_utils import (
-    get_prompt_language,
-    ensure_mongo_beanie_ready,
-    query_all_groups_from_mongodb,
-    query_memcells_by_group_and_time,
-    serialize_datetime,
-)
-from demo.utils.simple_memory_manager import SimpleMemoryManager
+import importlib
+
+from demo.utils.json_utils import json_loads, json_dumps
+
+# Public name -> defining module, resolved lazily by __getattr__
+_LAZY_EXPORTS = {
+    "get_prompt_language": "demo.utils.memory_utils",
+    "ensure_mongo_beanie_ready": "demo.utils.memory_utils",
+    "query_all_groups_from_mongodb": "demo.utils.memory_utils",
+    "count_memcells_by_group_and_time": "demo.utils.memory_utils",
+    "serialize_datetime": "demo.utils.memory_utils",
+    "SimpleMemoryManager": "demo.utils.simple_memory_manager",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "get_prompt_language",
     "ensure_mongo_beanie_ready",
     "query_all_groups_from_mongodb",
-    "query_memcells_by_group_and_time",
+    "count_memcells_by_group_and_time",
     "serialize_datetime",
+    "json_loads",
+    "json_dumps",
     "SimpleMemoryManager",
 ]
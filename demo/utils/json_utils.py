@@ -0,0 +1,69 @@
+"""JSON Helpers
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Both backends produce equivalent JSON, not identical text: orjson
+uses compact separators and serializes datetimes natively, where `json.dumps`
+adds spaces after `,`/`:` and calls `default`. Keys hashed from `json_dumps`
+output (e.g. `_profile_content_hash` in demo.chat.session) therefore depend on
+which backend is installed and must not be persisted or shared across
+environments.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document
+
+    Args:
+        data: JSON text (str or UTF-8 bytes)
+
+    Returns:
+        Parsed object
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(
+    obj: Any,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """Serialize an object to JSON text
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+        sort_keys: Sort object keys (for stable output, e.g. hashing)
+        default: Called for objects that are not natively serializable
+
+    Returns:
+        JSON text (non-ASCII characters are kept as-is; the exact formatting
+        depends on the backend)
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        sort_keys=sort_keys,
+        default=default,
+    )
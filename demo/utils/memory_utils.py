@@ -12,7 +12,6 @@ V4 Update:
 - Retained basic utility functions
 """
 
-import json
 import os
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -35,26 +34,40 @@ from common_utils.language_utils import get_prompt_language
 # MongoDB Tools
 # ============================================================================
 
+# Shared PyMongo async client (native asyncio, no thread pool), reused across
+# repeated initialization calls
+_mongo_client: Optional[AsyncMongoClient] = None
 
-async def ensure_mongo_beanie_ready(mongo_config: MongoDBConfig) -> None:
+
+async def ensure_mongo_beanie_ready(
+    mongo_config: MongoDBConfig, verbose: bool = True
+) -> None:
     """Initialize MongoDB and Beanie Connection
 
     Args:
         mongo_config: MongoDB configuration object
+        verbose: Print the connection status; callers running this in the
+            background pass False and report the outcome themselves
 
     Raises:
         Exception: If connection fails
     """
+    global _mongo_client
+
     # Set environment variable for Beanie use
     os.environ["MONGODB_URI"] = mongo_config.uri
 
-    # Create MongoDB client and test connection
-    client = AsyncMongoClient(mongo_config.uri)
+    # Create MongoDB client (once) and test connection
+    if _mongo_client is None:
+        _mongo_client = AsyncMongoClient(mongo_config.uri)
+    client = _mongo_client
     try:
         await client.admin.command('ping')
-        print(f"[MongoDB] ✅ Connected: {mongo_config.database}")
+        if verbose:
+            print(f"[MongoDB] ✅ Connected: {mongo_config.database}")
     except Exception as e:
-        print(f"[MongoDB] ❌ Connection failed: {e}")
+        if verbose:
+            print(f"[MongoDB] ❌ Connection failed: {e}")
         raise
 
     # Initialize Beanie document models
@@ -91,10 +104,13 @@ async def query_all_groups_from_mongodb() -> List[Dict[str, Any]]:
     return groups
 
 
-async def query_memcells_by_group_and_time(
+async def count_memcells_by_group_and_time(
     group_id: str, start_date: datetime, end_date: datetime
-) -> List[DocMemCell]:
-    """Query MemCells by Group and Time Range
+) -> int:
+    """Count MemCells by Group and Time Range
+
+    Counts on the server via the raw collection, without fetching or
+    hydrating Beanie documents.
 
     Args:
         group_id: Group ID
@@ -102,18 +118,13 @@ async def query_memcells_by_group_and_time(
         end_date: End date
 
     Returns:
-        List of MemCell document objects
+        Number of MemCells
     """
-    memcells = (
-        await DocMemCell.find(
-            {"group_id": group_id, "timestamp": {"$gte": start_date, "$lt": end_date}}
-        )
-        .sort("timestamp")
-        .to_list()
+    collection = DocMemCell.get_pymongo_collection()
+    return await collection.count_documents(
+        {"group_id": group_id, "timestamp": {"$gte": start_date, "$lt": end_date}}
     )
 
-    return memcells
-
 
 # ============================================================================
 # Time Serialization Tools
@@ -12,6 +12,7 @@ from common_utils.datetime_utils import (
     get_timezone,
     to_iso_format,
 )
+from demo.utils.json_utils import json_loads
 
 
 def extract_event_time_from_memory(mem: Dict[str, Any]) -> str:
@@ -143,7 +144,7 @@ class SimpleMemoryManager:
             async with httpx.AsyncClient(timeout=500.0) as client:
                 response = await client.post(self.memorize_url, json=message_data)
                 response.raise_for_status()
-                result = response.json()
+                result = json_loads(response.content)
 
                 if result.get("status") == "ok":
                     count = result.get("result", {}).get("count", 0)
@@ -208,7 +209,7 @@ class SimpleMemoryManager:
                     self.conversation_meta_url, json=conversation_meta_request
                 )
                 response.raise_for_status()
-                result = response.json()
+                result = json_loads(response.content)
 
                 if result.get("status") == "ok":
                     self._conversation_meta_saved = True
@@ -267,7 +268,7 @@ class SimpleMemoryManager:
             async with httpx.AsyncClient(timeout=30.0) as client:
                 response = await client.get(self.retrieve_url, params=payload)
                 response.raise_for_status()
-                result = response.json()
+                result = json_loads(response.content)
 
                 if result.get("status") == "ok":
                     # memories is grouped: [{"group_id": [Memory, ...]}, ...]
@@ -420,6 +420,7 @@ async def search_with_emb_index(
     emb_index,
     top_n: int = 5,
     query_embedding: Optional[np.ndarray] = None,  # Support pre-computed embedding
+    stacked_embeddings: Optional["_StackedEmbeddings"] = None,
 ):
     """
     Execute embedding retrieval using MaxSim strategy.
@@ -439,6 +440,9 @@ async def search_with_emb_index(
         emb_index: Pre-built embedding index
         top_n: Number of results to return
         query_embedding: Optional pre-computed query embedding (avoid redundant computation)
+        stacked_embeddings: `_StackedEmbeddings(emb_index)` built by the caller,
+            to share it across the searches of one retrieval (built for this
+            call otherwise)
 
     Returns:
         Sorted (document, score) list
@@ -455,47 +459,83 @@ async def search_with_emb_index(
     if query_norm == 0:
         return []
 
-    # Store MaxSim score for each document
-    doc_scores = []
-
-    for item in emb_index:
-        doc = item.get("doc")
-        embeddings = item.get("embeddings", {})
-
-        if not embeddings:
-            continue
-
-        # Prefer atomic_facts (MaxSim strategy)
-        if "atomic_facts" in embeddings:
-            atomic_fact_embs = embeddings["atomic_facts"]
-            if atomic_fact_embs:
-                # Use MaxSim to compute score
-                score = compute_maxsim_score(query_vec, atomic_fact_embs)
-                doc_scores.append((doc, score))
-                continue
-
-        # Fall back to traditional fields (maintain backward compatibility)
-        # For traditional fields, also use MaxSim strategy (take maximum)
-        field_scores = []
-        for field in ["subject", "summary", "episode"]:
-            if field in embeddings:
-                field_emb = embeddings[field]
-                field_norm = np.linalg.norm(field_emb)
-
-                if field_norm > 0:
-                    sim = np.dot(query_vec, field_emb) / (query_norm * field_norm)
-                    field_scores.append(sim)
-
-        if field_scores:
-            score = max(field_scores)
-            doc_scores.append((doc, score))
+    # Score every stored vector with one matrix-vector product, then keep
+    # each document's best score (MaxSim over atomic_facts or fields)
+    stacked = stacked_embeddings
+    if stacked is None:
+        stacked = _StackedEmbeddings(emb_index)
+    if not stacked.docs:
+        return []
+    query_unit = np.asarray(query_vec, dtype=np.float32) / np.float32(query_norm)
+    doc_scores = np.full(len(stacked.docs), -np.inf, dtype=np.float32)
+    if len(stacked.row_docs):
+        doc_scores[stacked.row_docs] = np.maximum.reduceat(
+            stacked.matrix @ query_unit, stacked.row_starts
+        )
+    # Documents whose atomic_facts are all zero vectors still score 0.0
+    doc_scores[stacked.maxsim_docs & np.isneginf(doc_scores)] = 0.0
 
-    if not doc_scores:
+    scored = np.flatnonzero(np.isfinite(doc_scores))
+    if top_n <= 0 or scored.size == 0:
         return []
+    # Partition out the top_n before sorting so only those rows are ordered;
+    # the stable sort keeps index order among equal scores, like sorted()
+    if scored.size > top_n:
+        top = np.argpartition(-doc_scores[scored], top_n - 1)[:top_n]
+        scored = np.sort(scored[top])
+    order = scored[np.argsort(-doc_scores[scored], kind="stable")]
+    return [(stacked.docs[i], float(doc_scores[i])) for i in order]
+
+
+class _StackedEmbeddings:
+    """Every vector of an embedding index as one L2-normalized float32 matrix.
+
+    Each document's rows are contiguous: document ``row_docs[j]`` owns the rows
+    from ``row_starts[j]`` up to the next start, so per-document MaxSim is one
+    ``np.maximum.reduceat``. A document contributes its atomic_fact vectors
+    when it has any, otherwise its subject/summary/episode vectors; zero
+    vectors are dropped, as in the per-pair scoring.
+    """
 
-    # Sort by score descending and return Top-N
-    sorted_results = sorted(doc_scores, key=lambda x: x[1], reverse=True)
-    return sorted_results[:top_n]
+    def __init__(self, emb_index):
+        self.docs = []
+        rows = []
+        owners = []
+        maxsim_docs = []
+        for item in emb_index:
+            embeddings = item.get("embeddings", {})
+            if not embeddings:
+                continue
+            vectors = embeddings.get("atomic_facts")
+            is_maxsim = vectors is not None and len(vectors) > 0
+            if not is_maxsim:
+                vectors = [
+                    embeddings[field]
+                    for field in ("subject", "summary", "episode")
+                    if field in embeddings
+                ]
+                if not vectors:
+                    continue
+            doc_idx = len(self.docs)
+            self.docs.append(item.get("doc"))
+            maxsim_docs.append(is_maxsim)
+            rows.extend(vectors)
+            owners.extend([doc_idx] * len(vectors))
+
+        if rows:
+            matrix = np.asarray(rows, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1)
+            valid = norms > 0
+            self.matrix = np.ascontiguousarray(matrix[valid] / norms[valid, None])
+            owners = np.asarray(owners, dtype=np.intp)[valid]
+            # owners is non-decreasing, so each document's first row marks
+            # where its segment starts
+            self.row_docs, self.row_starts = np.unique(owners, return_index=True)
+        else:
+            self.matrix = np.zeros((0, 0), dtype=np.float32)
+            self.row_docs = np.zeros(0, dtype=np.intp)
+            self.row_starts = np.zeros(0, dtype=np.intp)
+        self.maxsim_docs = np.asarray(maxsim_docs, dtype=bool)
 
 
 async def hybrid_search_with_rrf(
@@ -508,6 +548,7 @@ async def hybrid_search_with_rrf(
     bm25_candidates: int = 50,
     rrf_k: int = 60,
     query_embedding: Optional[np.ndarray] = None,  # Support pre-computed embedding
+    stacked_embeddings: Optional["_StackedEmbeddings"] = None,
 ) -> List[Tuple[dict, float]]:
     """
     Fuse Embedding and BM25 retrieval results using RRF (hybrid retrieval).
@@ -532,6 +573,8 @@ async def hybrid_search_with_rrf(
         emb_candidates: Number of Embedding retrieval candidates (default 50)
         bm25_candidates: Number of BM25 retrieval candidates (default 50)
         rrf_k: RRF parameter k (default 60, empirically optimal)
+        stacked_embeddings: Stacked form of `emb_index` shared by the caller
+            (optional, see `search_with_emb_index`)
 
     Returns:
         Fused Top-N results [(doc, rrf_score), ...]
@@ -558,7 +601,11 @@ async def hybrid_search_with_rrf(
     """
     # Execute Embedding and BM25 retrieval in parallel (improve efficiency)
     emb_task = search_with_emb_index(
-        query, emb_index, top_n=emb_candidates, query_embedding=query_embedding
+        query,
+        emb_index,
+        top_n=emb_candidates,
+        query_embedding=query_embedding,
+        stacked_embeddings=stacked_embeddings,
     )
     bm25_task = asyncio.to_thread(
         search_with_bm25_index, query, bm25, docs, bm25_candidates
@@ -641,6 +688,9 @@ async def agentic_retrieval(
     print(f"{'='*60}")
     print(f"  [Start] Time: {time.strftime('%H:%M:%S')}")
 
+    # Stack the index vectors once, shared by Round 1 and Round 2
+    stacked_embeddings = _StackedEmbeddings(emb_index)
+
     # Round 1: Hybrid search Top 20
     print(f"  [Round 1] Hybrid search for Top 20...")
 
@@ -653,6 +703,7 @@ async def agentic_retrieval(
         emb_candidates=config.hybrid_emb_candidates,
         bm25_candidates=config.hybrid_bm25_candidates,
         rrf_k=config.hybrid_rrf_k,
+        stacked_embeddings=stacked_embeddings,
     )
 
     metadata["round1_count"] = len(round1_top20)
@@ -768,6 +819,7 @@ async def agentic_retrieval(
                 emb_candidates=config.hybrid_emb_candidates,
                 bm25_candidates=config.hybrid_bm25_candidates,
                 rrf_k=config.hybrid_rrf_k,
+                stacked_embeddings=stacked_embeddings,
             )
             for q in refined_queries
         ]
@@ -827,6 +879,7 @@ async def agentic_retrieval(
             emb_candidates=config.hybrid_emb_candidates,
             bm25_candidates=config.hybrid_bm25_candidates,
             rrf_k=config.hybrid_rrf_k,
+            stacked_embeddings=stacked_embeddings,
         )
 
         metadata["round2_count"] = len(round2_results)
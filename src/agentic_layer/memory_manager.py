@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
 import logging
 import asyncio
 
@@ -297,41 +297,13 @@ class MemoryManager:
         self, retrieve_mem_request: 'RetrieveMemRequest'
     ) -> RetrieveMemResponse:
         """Keyword-based memory retrieval"""
-        start_time = time.perf_counter()
-        memory_type = (
-            retrieve_mem_request.memory_types[0].value
-            if retrieve_mem_request.memory_types
-            else 'unknown'
+        return await self._retrieve_with_metrics(
+            retrieve_mem_request,
+            RetrieveMethod.KEYWORD.value,
+            self.get_keyword_search_results,
+            exc_info=True,
         )
 
-        try:
-            hits = await self.get_keyword_search_results(
-                retrieve_mem_request, retrieve_method=RetrieveMethod.KEYWORD.value
-            )
-            duration = time.perf_counter() - start_time
-            status = 'success' if hits else 'empty_result'
-
-            record_retrieve_request(
-                memory_type=memory_type,
-                retrieve_method=RetrieveMethod.KEYWORD.value,
-                status=status,
-                duration_seconds=duration,
-                results_count=len(hits),
-            )
-
-            return await self._to_response(hits, retrieve_mem_request)
-        except Exception as e:
-            duration = time.perf_counter() - start_time
-            record_retrieve_request(
-                memory_type=memory_type,
-                retrieve_method=RetrieveMethod.KEYWORD.value,
-                status='error',
-                duration_seconds=duration,
-                results_count=0,
-            )
-            logger.error(f"Error in retrieve_mem_keyword: {e}", exc_info=True)
-            return await self._to_response([], retrieve_mem_request)
-
     async def get_keyword_search_results(
         self,
         retrieve_mem_request: 'RetrieveMemRequest',
@@ -432,41 +404,12 @@ class MemoryManager:
         self, retrieve_mem_request: 'RetrieveMemRequest'
     ) -> RetrieveMemResponse:
         """Vector-based memory retrieval"""
-        start_time = time.perf_counter()
-        memory_type = (
-            retrieve_mem_request.memory_types[0].value
-            if retrieve_mem_request.memory_types
-            else 'unknown'
+        return await self._retrieve_with_metrics(
+            retrieve_mem_request,
+            RetrieveMethod.VECTOR.value,
+            self.get_vector_search_results,
         )
 
-        try:
-            hits = await self.get_vector_search_results(
-                retrieve_mem_request, retrieve_method=RetrieveMethod.VECTOR.value
-            )
-            duration = time.perf_counter() - start_time
-            status = 'success' if hits else 'empty_result'
-
-            record_retrieve_request(
-                memory_type=memory_type,
-                retrieve_method=RetrieveMethod.VECTOR.value,
-                status=status,
-                duration_seconds=duration,
-                results_count=len(hits),
-            )
-
-            return await self._to_response(hits, retrieve_mem_request)
-        except Exception as e:
-            duration = time.perf_counter() - start_time
-            record_retrieve_request(
-                memory_type=memory_type,
-                retrieve_method=RetrieveMethod.VECTOR.value,
-                status='error',
-                duration_seconds=duration,
-                results_count=0,
-            )
-            logger.error(f"Error in retrieve_mem_vector: {e}")
-            return await self._to_response([], retrieve_mem_request)
-
     async def get_vector_search_results(
         self,
         retrieve_mem_request: 'RetrieveMemRequest',
@@ -623,6 +566,23 @@ class MemoryManager:
         self, retrieve_mem_request: 'RetrieveMemRequest'
     ) -> RetrieveMemResponse:
         """Hybrid memory retrieval: keyword + vector + rerank"""
+        return await self._retrieve_with_metrics(
+            retrieve_mem_request, RetrieveMethod.HYBRID.value, self._search_hybrid
+        )
+
+    # ================== Core Internal Methods ==================
+
+    async def _retrieve_with_metrics(
+        self,
+        retrieve_mem_request: 'RetrieveMemRequest',
+        retrieve_method: str,
+        search: Callable[..., Awaitable[List[Dict[str, Any]]]],
+        exc_info: bool = False,
+    ) -> RetrieveMemResponse:
+        """Run one retrieval method, record request metrics and build the response
+
+        Errors are logged and recorded, and an empty response is returned.
+        """
         start_time = time.perf_counter()
         memory_type = (
             retrieve_mem_request.memory_types[0].value
@@ -631,15 +591,13 @@ class MemoryManager:
         )
 
         try:
-            hits = await self._search_hybrid(
-                retrieve_mem_request, retrieve_method=RetrieveMethod.HYBRID.value
-            )
+            hits = await search(retrieve_mem_request, retrieve_method=retrieve_method)
             duration = time.perf_counter() - start_time
             status = 'success' if hits else 'empty_result'
 
             record_retrieve_request(
                 memory_type=memory_type,
-                retrieve_method=RetrieveMethod.HYBRID.value,
+                retrieve_method=retrieve_method,
                 status=status,
                 duration_seconds=duration,
                 results_count=len(hits),
@@ -650,16 +608,16 @@ class MemoryManager:
             duration = time.perf_counter() - start_time
             record_retrieve_request(
                 memory_type=memory_type,
-                retrieve_method=RetrieveMethod.HYBRID.value,
+                retrieve_method=retrieve_method,
                 status='error',
                 duration_seconds=duration,
                 results_count=0,
             )
-            logger.error(f"Error in retrieve_mem_hybrid: {e}")
+            logger.error(
+                f"Error in {retrieve_method} memory retrieval: {e}", exc_info=exc_info
+            )
             return await self._to_response([], retrieve_mem_request)
 
-    # ================== Core Internal Methods ==================
-
     async def _rerank(
         self,
         query: str,
@@ -807,41 +765,13 @@ class MemoryManager:
         self, retrieve_mem_request: 'RetrieveMemRequest'
     ) -> RetrieveMemResponse:
         """RRF-based memory retrieval: keyword + vector + RRF fusion"""
-        start_time = time.perf_counter()
-        memory_type = (
-            retrieve_mem_request.memory_types[0].value
-            if retrieve_mem_request.memory_types
-            else 'unknown'
+        return await self._retrieve_with_metrics(
+            retrieve_mem_request,
+            RetrieveMethod.RRF.value,
+            self._search_rrf,
+            exc_info=True,
         )
 
-        try:
-            hits = await self._search_rrf(
-                retrieve_mem_request, retrieve_method=RetrieveMethod.RRF.value
-            )
-            duration = time.perf_counter() - start_time
-            status = 'success' if hits else 'empty_result'
-
-            record_retrieve_request(
-                memory_type=memory_type,
-                retrieve_method=RetrieveMethod.RRF.value,
-                status=status,
-                duration_seconds=duration,
-                results_count=len(hits),
-            )
-
-            return await self._to_response(hits, retrieve_mem_request)
-        except Exception as e:
-            duration = time.perf_counter() - start_time
-            record_retrieve_request(
-                memory_type=memory_type,
-                retrieve_method=RetrieveMethod.RRF.value,
-                status='error',
-                duration_seconds=duration,
-                results_count=0,
-            )
-            logger.error(f"Error in retrieve_mem_rrf: {e}", exc_info=True)
-            return await self._to_response([], retrieve_mem_request)
-
     # --------- Agentic retrieval (LLM-guided multi-round) ---------
     @trace_logger(operation_name="agentic_layer Agentic memory retrieval")
     async def retrieve_mem_agentic(
@@ -952,13 +882,19 @@ class MemoryManager:
             round2_results = await asyncio.gather(
                 *[do_search(q) for q in refined_queries], return_exceptions=True
             )
-            all_round2 = [
-                h for r in round2_results if not isinstance(r, Exception) for h in r
-            ]
 
-            # Deduplicate and merge
+            # Deduplicate in one pass, against Round 1 and across the refined
+            # queries (they often retrieve the same memories)
             seen_ids = {m.get("id") for m in round1}
-            round2_unique = [m for m in all_round2 if m.get("id") not in seen_ids]
+            round2_unique = []
+            for r in round2_results:
+                if isinstance(r, Exception):
+                    continue
+                for m in r:
+                    hit_id = m.get("id")
+                    if hit_id not in seen_ids:
+                        seen_ids.add(hit_id)
+                        round2_unique.append(m)
             combined = round1 + round2_unique[: config.combined_total - len(round1)]
             logger.info(f"Combined: {len(combined)} memories")
 
@@ -35,6 +35,8 @@ Usage:
     ).observe(0.123)
 """
 
+import time
+
 from core.observation.metrics import Counter, Histogram, HistogramBuckets
 
 
@@ -254,6 +256,16 @@ class RetrieveMetricsContext:
                 return reranked
     """
 
+    __slots__ = [
+        'memory_type',
+        'retrieve_method',
+        'start_time',
+        'results_count',
+        'status',
+        '_current_stage',
+        '_stage_start_time',
+    ]
+
     def __init__(self, memory_type: str, retrieve_method: str):
         self.memory_type = memory_type
         self.retrieve_method = retrieve_method
@@ -264,15 +276,11 @@ class RetrieveMetricsContext:
         self._stage_start_time = None
 
     def __enter__(self):
-        import time
-
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        import time
-
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self.start_time
 
         if exc_type is not None:
             self.status = 'error'
@@ -303,21 +311,19 @@ class RetrieveMetricsContext:
 class _StageContext:
     """Internal context manager for stage timing"""
 
+    __slots__ = ['parent', 'stage_name', 'start_time']
+
     def __init__(self, parent: RetrieveMetricsContext, stage_name: str):
         self.parent = parent
         self.stage_name = stage_name
         self.start_time = None
 
     def __enter__(self):
-        import time
-
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        import time
-
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self.start_time
 
         record_retrieve_stage(
             retrieve_method=self.parent.retrieve_method,
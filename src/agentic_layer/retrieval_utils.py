@@ -7,12 +7,14 @@ Provides implementations of various retrieval strategies:
 - Agentic retrieval (LLM-guided multi-round retrieval)
 """
 
+import math
 import re
 import time
 import jieba
 import numpy as np
 import logging
 import asyncio
+import functools
 from typing import List, Tuple, Dict, Any, Optional
 from core.nlp.stopwords_utils import filter_stopwords as filter_chinese_stopwords
 from .vectorize_service import get_vectorize_service
@@ -39,7 +41,7 @@ def _safe_cosine_similarity(
         if doc_vec.shape != query_vec.shape:
             return None
 
-        doc_norm = np.linalg.norm(doc_vec)
+        doc_norm = math.sqrt(float(np.dot(doc_vec, doc_vec)))
         if doc_norm <= 0:
             return None
 
@@ -52,54 +54,198 @@ def _safe_cosine_similarity(
         return None
 
 
-def build_bm25_index(candidates):
-    """Build BM25 index (supports Chinese and English)"""
+def _top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Indices of the `top_k` highest scores, best first
+
+    Uses argpartition so only the selected rows are sorted instead of all N.
+    """
+    if top_k <= 0 or scores.size == 0:
+        return np.empty(0, dtype=np.intp)
+    if scores.size > top_k:
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        top = np.arange(scores.size)
+    return top[np.argsort(-scores[top], kind="stable")]
+
+
+def _candidate_embedding(candidate: Any) -> Optional[Any]:
+    """Return a candidate's raw embedding sequence, or None if absent."""
+    candidate_extend = getattr(candidate, "extend", None)
+    if not isinstance(candidate_extend, dict):
+        return None
+    embedding = candidate_extend.get("embedding")
+    if not isinstance(embedding, (list, tuple, np.ndarray)) or len(embedding) == 0:
+        return None
+    return embedding
+
+
+class CandidateEmbeddingIndex:
+    """Structure-of-arrays view of candidate embeddings
+
+    Usable embeddings are stacked once into a contiguous float32 matrix of
+    L2-normalized rows, with `candidates[i]` owning row `i`. A query then costs
+    a single matrix-vector product, and one index can be shared by every query
+    run against the same candidate list.
+
+    Candidates without a usable embedding (missing, wrong dimension, malformed,
+    zero norm) are left out, matching `_safe_cosine_similarity`.
+    """
+
+    def __init__(self, candidates, dim: Optional[int] = None):
+        """Build the index
+
+        Args:
+            candidates: Candidate memories carrying `extend["embedding"]`
+            dim: Expected embedding dimension (inferred from the first
+                usable embedding when omitted)
+        """
+        rows = []
+        owners = []
+        for mem in candidates:
+            embedding = _candidate_embedding(mem)
+            if embedding is None:
+                continue
+            if dim is None:
+                dim = len(embedding)
+            if len(embedding) != dim:
+                continue
+            rows.append(embedding)
+            owners.append(mem)
+
+        self.dim: Optional[int] = dim
+        matrix, owners = self._stack_rows(rows, owners, dim or 0)
+
+        # float32 halves memory traffic; einsum computes row norms without the
+        # N x D temporary that np.linalg.norm(axis=1) allocates
+        norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))
+        keep = np.flatnonzero((norms > 0) & np.isfinite(norms))
+        self.matrix: np.ndarray = np.ascontiguousarray(
+            matrix[keep] / norms[keep, None]
+        )
+        self.candidates: List[Any] = [owners[i] for i in keep]
+
+    @staticmethod
+    def _stack_rows(rows: List[Any], owners: List[Any], dim: int):
+        """Stack rows into an (N, dim) float32 matrix, dropping malformed ones."""
+        try:
+            return np.asarray(rows, dtype=np.float32).reshape(len(rows), dim), owners
+        except (TypeError, ValueError):
+            pass
+
+        kept_rows = []
+        kept_owners = []
+        for row, mem in zip(rows, owners):
+            try:
+                vec = np.asarray(row, dtype=np.float32)
+            except (TypeError, ValueError):
+                continue
+            if vec.shape == (dim,):
+                kept_rows.append(vec)
+                kept_owners.append(mem)
+        matrix = np.asarray(kept_rows, dtype=np.float32).reshape(len(kept_rows), dim)
+        return matrix, kept_owners
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def top_k(self, query_vec: np.ndarray, top_k: int) -> List[Tuple[Any, float]]:
+        """Return the Top-K candidates by cosine similarity
+
+        Args:
+            query_vec: Query embedding
+            top_k: Number of results
+
+        Returns:
+            [(candidate, score), ...] sorted by score in descending order
+        """
+        if top_k <= 0 or not self.candidates:
+            return []
+
+        query = np.asarray(query_vec, dtype=np.float32)
+        if query.shape != (self.dim,):
+            return []
+        query_norm = math.sqrt(float(np.dot(query, query)))
+        if not np.isfinite(query_norm) or query_norm <= 0:
+            return []
+
+        scores = self.matrix @ (query / query_norm)
+        valid = np.flatnonzero(np.isfinite(scores))
+        if valid.size == 0:
+            return []
+
+        valid_scores = scores[valid]
+        top = _top_k_indices(valid_scores, top_k)
+
+        return [(self.candidates[valid[i]], float(valid_scores[i])) for i in top]
+
+
+# Number of distinct document texts whose BM25 tokens are kept between calls
+_BM25_TOKEN_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=1)
+def _load_english_nlp():
+    """Import NLTK and make sure its data is present, once per process
+
+    Returns:
+        (word_tokenize, stemmer, stop_words), or None when NLTK or rank_bm25
+        is not installed
+    """
     try:
         import nltk
         from nltk.corpus import stopwords
         from nltk.stem import PorterStemmer
         from nltk.tokenize import word_tokenize
-        from rank_bm25 import BM25Okapi
-    except ImportError as e:
-        return None, None, None, None
+        import rank_bm25  # noqa: F401
+    except ImportError:
+        return None
 
     # Ensure NLTK data is downloaded
-    try:
-        nltk.data.find("tokenizers/punkt")
-    except LookupError:
-        nltk.download("punkt", quiet=True)
+    for resource, package in (
+        ("tokenizers/punkt", "punkt"),
+        ("tokenizers/punkt_tab", "punkt_tab"),
+        ("corpora/stopwords", "stopwords"),
+    ):
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            nltk.download(package, quiet=True)
 
-    try:
-        nltk.data.find("tokenizers/punkt_tab")
-    except LookupError:
-        nltk.download("punkt_tab", quiet=True)
+    return word_tokenize, PorterStemmer(), frozenset(stopwords.words("english"))
 
-    try:
-        nltk.data.find("corpora/stopwords")
-    except LookupError:
-        nltk.download("stopwords", quiet=True)
-
-    stemmer = PorterStemmer()
-    stop_words = set(stopwords.words("english"))
-
-    # Extract text and tokenize (supports Chinese and English)
-    tokenized_docs = []
-    for mem in candidates:
-        text = getattr(mem, "episode", None) or getattr(mem, "summary", "") or ""
-        has_chinese = bool(re.search(r'[\u4e00-\u9fff]', text))
-
-        if has_chinese:
-            tokens = list(jieba.cut(text))
-            processed_tokens = filter_chinese_stopwords(tokens)
-        else:
-            tokens = word_tokenize(text.lower())
-            processed_tokens = [
-                stemmer.stem(token)
-                for token in tokens
-                if token.isalpha() and len(token) >= 2 and token not in stop_words
-            ]
 
-        tokenized_docs.append(processed_tokens)
+@functools.lru_cache(maxsize=_BM25_TOKEN_CACHE_SIZE)
+def _tokenize_bm25_document(text: str) -> Tuple[str, ...]:
+    """Tokenize one document for BM25 (supports Chinese and English)
+
+    Cached by text, so documents seen by earlier calls are not re-tokenized.
+    Only called after `_load_english_nlp()` has succeeded.
+    """
+    if re.search(r'[\u4e00-\u9fff]', text):
+        return tuple(filter_chinese_stopwords(list(jieba.cut(text))))
+
+    word_tokenize, stemmer, stop_words = _load_english_nlp()
+    return tuple(
+        stemmer.stem(token)
+        for token in word_tokenize(text.lower())
+        if token.isalpha() and len(token) >= 2 and token not in stop_words
+    )
+
+
+def build_bm25_index(candidates):
+    """Build BM25 index (supports Chinese and English)"""
+    nlp = _load_english_nlp()
+    if nlp is None:
+        return None, None, None, None
+    from rank_bm25 import BM25Okapi
+
+    _, stemmer, stop_words = nlp
+    tokenized_docs = [
+        _tokenize_bm25_document(
+            getattr(mem, "episode", None) or getattr(mem, "summary", "") or ""
+        )
+        for mem in candidates
+    ]
 
     bm25 = BM25Okapi(tokenized_docs)
     return bm25, tokenized_docs, stemmer, stop_words
@@ -135,12 +281,10 @@ async def search_with_bm25(
         return []
 
     # Calculate BM25 scores
-    scores = bm25.get_scores(tokenized_query)
+    scores = np.asarray(bm25.get_scores(tokenized_query), dtype=float)
 
-    # Sort and return Top-K
-    results = sorted(zip(candidates, scores), key=lambda x: x[1], reverse=True)[:top_k]
-
-    return results
+    # Select Top-K without sorting every candidate; only K result tuples are built
+    return [(candidates[i], float(scores[i])) for i in _top_k_indices(scores, top_k)]
 
 
 def reciprocal_rank_fusion(
@@ -173,15 +317,38 @@ def reciprocal_rank_fusion(
     return fused_results
 
 
+async def _ensure_bm25_index(candidates, bm25_index: Optional[Tuple]) -> Tuple:
+    """Return `bm25_index`, building it in a worker thread when it is None."""
+    if bm25_index is not None:
+        return bm25_index
+    return await asyncio.to_thread(build_bm25_index, candidates)
+
+
+async def _embed_query(query: str, query_vec: Optional[np.ndarray]) -> np.ndarray:
+    """Return `query_vec`, embedding `query` when it is None."""
+    if query_vec is not None:
+        return query_vec
+    return await get_vectorize_service().get_embedding(query)
+
+
 async def lightweight_retrieval(
     query: str,
     candidates,
     emb_top_n: int = 50,
     bm25_top_n: int = 50,
     final_top_n: int = 20,
+    embedding_index: Optional[CandidateEmbeddingIndex] = None,
+    query_vec: Optional[np.ndarray] = None,
+    bm25_index: Optional[Tuple] = None,
 ) -> Tuple:
-    """Lightweight retrieval (Embedding + BM25 + RRF fusion)"""
-    start_time = time.time()
+    """Lightweight retrieval (Embedding + BM25 + RRF fusion)
+
+    Pass a prebuilt `embedding_index` for `candidates` to reuse it across
+    queries; otherwise one is built for this call. Pass `query_vec` when the
+    query was already embedded (e.g. in a batch); otherwise it is embedded here.
+    Likewise `bm25_index` takes the result of `build_bm25_index(candidates)`.
+    """
+    start_time = time.perf_counter()
 
     metadata = {
         "retrieval_mode": "lightweight",
@@ -192,29 +359,32 @@ async def lightweight_retrieval(
     }
 
     if not candidates:
-        metadata["total_latency_ms"] = (time.time() - start_time) * 1000
+        metadata["total_latency_ms"] = (time.perf_counter() - start_time) * 1000
         return [], metadata
 
-    # Build BM25 index
-    bm25, tokenized_docs, stemmer, stop_words = build_bm25_index(candidates)
+    # Embed the query while the BM25 index (unless shared by the caller) is
+    # built off the event loop
+    query_vec, bm25_index = await asyncio.gather(
+        _embed_query(query, query_vec),
+        _ensure_bm25_index(candidates, bm25_index),
+        return_exceptions=True,
+    )
+    if isinstance(bm25_index, BaseException):
+        raise bm25_index
+    bm25, tokenized_docs, stemmer, stop_words = bm25_index
 
     # Embedding retrieval
     emb_results = []
     try:
-        vectorize_service = get_vectorize_service()
-        query_vec = np.asarray(
-            await vectorize_service.get_embedding(query), dtype=float
-        )
-        query_norm = np.linalg.norm(query_vec)
-
-        if query_norm > 0:
-            scores = []
-            for mem in candidates:
-                sim = _safe_cosine_similarity(query_vec, query_norm, mem)
-                if sim is not None:
-                    scores.append((mem, sim))
+        if isinstance(query_vec, BaseException):
+            raise query_vec
+        query_vec = np.asarray(query_vec, dtype=np.float32)
+        if embedding_index is None or embedding_index.dim != query_vec.shape[0]:
+            embedding_index = CandidateEmbeddingIndex(
+                candidates, dim=query_vec.shape[0]
+            )
 
-            emb_results = sorted(scores, key=lambda x: x[1], reverse=True)[:emb_top_n]
+        emb_results = embedding_index.top_k(query_vec, emb_top_n)
     except Exception as e:
         logger.warning(
             "Embedding retrieval failed in lightweight_retrieval, falling back: %s", e
@@ -233,7 +403,7 @@ async def lightweight_retrieval(
 
     # RRF fusion
     if not emb_results and not bm25_results:
-        metadata["total_latency_ms"] = (time.time() - start_time) * 1000
+        metadata["total_latency_ms"] = (time.perf_counter() - start_time) * 1000
         return [], metadata
     elif not emb_results:
         final_results = bm25_results[:final_top_n]
@@ -244,7 +414,7 @@ async def lightweight_retrieval(
         final_results = fused_results[:final_top_n]
 
     metadata["final_count"] = len(final_results)
-    metadata["total_latency_ms"] = (time.time() - start_time) * 1000
+    metadata["total_latency_ms"] = (time.perf_counter() - start_time) * 1000
 
     return final_results, metadata
 
@@ -321,6 +491,8 @@ async def multi_query_retrieval(
     bm25_top_n: int = 50,
     final_top_n: int = 40,
     rrf_k: int = 60,
+    embedding_index: Optional[CandidateEmbeddingIndex] = None,
+    bm25_index: Optional[Tuple] = None,
 ) -> Tuple[List[Tuple], Dict[str, Any]]:
     """
     Multi-query parallel retrieval + RRF fusion
@@ -340,6 +512,10 @@ async def multi_query_retrieval(
         bm25_top_n: Number of BM25 candidates per query
         final_top_n: Number of documents to return after fusion
         rrf_k: RRF parameter
+        embedding_index: Prebuilt embedding index for candidates (optional,
+            built once here and shared by all queries otherwise)
+        bm25_index: Result of `build_bm25_index(candidates)` (optional, built
+            once here and shared by all queries otherwise)
 
     Returns:
         (results, metadata)
@@ -356,7 +532,7 @@ async def multi_query_retrieval(
         >>> print(len(results))  # 40
         >>> print(metadata["num_queries"])  # 3
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     metadata = {
         "retrieval_mode": "multi_query",
@@ -368,15 +544,50 @@ async def multi_query_retrieval(
     }
 
     if not queries or not candidates:
-        metadata["total_latency_ms"] = (time.time() - start_time) * 1000
+        metadata["total_latency_ms"] = (time.perf_counter() - start_time) * 1000
         return [], metadata
 
     logger.info(f"Executing {len(queries)} queries in parallel...")
 
+    # Stack candidate embeddings once for all queries
+    if embedding_index is None:
+        embedding_index = CandidateEmbeddingIndex(candidates)
+
+    # Embed all queries in one batched request instead of one call per query,
+    # while the shared BM25 index is built off the event loop
+    async def embed_queries():
+        return await get_vectorize_service().get_embeddings(list(queries))
+
+    embeddings, bm25_index = await asyncio.gather(
+        embed_queries(),
+        _ensure_bm25_index(candidates, bm25_index),
+        return_exceptions=True,
+    )
+    if isinstance(bm25_index, BaseException):
+        raise bm25_index
+
+    query_vecs: List[Optional[np.ndarray]] = [None] * len(queries)
+    if isinstance(embeddings, BaseException):
+        logger.warning(
+            "Batched query embedding failed, embedding queries individually: %s",
+            embeddings,
+        )
+    elif len(embeddings) == len(queries):
+        query_vecs = list(embeddings)
+
     # Execute hybrid retrieval for all queries in parallel
     tasks = [
-        lightweight_retrieval(q, candidates, emb_top_n, bm25_top_n, final_top_n)
-        for q in queries
+        lightweight_retrieval(
+            q,
+            candidates,
+            emb_top_n,
+            bm25_top_n,
+            final_top_n,
+            embedding_index=embedding_index,
+            query_vec=q_vec,
+            bm25_index=bm25_index,
+        )
+        for q, q_vec in zip(queries, query_vecs)
     ]
 
     multi_query_results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -402,7 +613,7 @@ async def multi_query_retrieval(
 
     if not valid_results:
         logger.warning("All queries failed")
-        metadata["total_latency_ms"] = (time.time() - start_time) * 1000
+        metadata["total_latency_ms"] = (time.perf_counter() - start_time) * 1000
         return [], metadata
 
     # Count total documents before fusion
@@ -416,7 +627,7 @@ async def multi_query_retrieval(
     final_results = fused_results[:final_top_n]
 
     metadata["final_count"] = len(final_results)
-    metadata["total_latency_ms"] = (time.time() - start_time) * 1000
+    metadata["total_latency_ms"] = (time.perf_counter() - start_time) * 1000
 
     logger.info(
         f"Multi-query retrieval: {metadata['total_docs_before_fusion']} → {len(final_results)} docs"
@@ -569,7 +780,7 @@ async def agentic_retrieval(
     if config is None:
         config = AgenticConfig()
 
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     metadata = {
         "retrieval_mode": "agentic",
@@ -589,6 +800,11 @@ async def agentic_retrieval(
     logger.info(f"Agentic Retrieval: {query[:60]}...")
     logger.info(f"{'='*60}")
 
+    # Candidate embeddings are stacked and the BM25 index is built once, then
+    # shared by Round 1 and Round 2
+    embedding_index = CandidateEmbeddingIndex(candidates)
+    bm25_index = await _ensure_bm25_index(candidates, None)
+
     # ========== Round 1: Hybrid search Top 20 ==========
     logger.info("Round 1: Hybrid search for Top 20...")
 
@@ -599,6 +815,8 @@ async def agentic_retrieval(
             emb_top_n=config.round1_emb_top_n,
             bm25_top_n=config.round1_bm25_top_n,
             final_top_n=config.round1_top_n,
+            embedding_index=embedding_index,
+            bm25_index=bm25_index,
         )
 
         metadata["round1_count"] = len(round1_results)
@@ -608,12 +826,12 @@ async def agentic_retrieval(
 
         if not round1_results:
             logger.warning("Round 1 returned no results")
-            metadata["total_latency_ms"] = (time.time() - start_time) * 1000
+            metadata["total_latency_ms"] = (time.perf_counter() - start_time) * 1000
             return [], metadata
 
     except Exception as e:
         logger.error(f"Round 1 failed: {e}")
-        metadata["total_latency_ms"] = (time.time() - start_time) * 1000
+        metadata["total_latency_ms"] = (time.perf_counter() - start_time) * 1000
         return [], metadata
 
     # ========== Rerank Top 20 → Top 5 for Sufficiency Check ==========
@@ -644,7 +862,7 @@ async def agentic_retrieval(
 
     if not reranked_top5:
         logger.warning("No results for sufficiency check, returning Round 1 results")
-        metadata["total_latency_ms"] = (time.time() - start_time) * 1000
+        metadata["total_latency_ms"] = (time.perf_counter() - start_time) * 1000
         return round1_results, metadata
 
     # ========== LLM Sufficiency Check ==========
@@ -669,7 +887,7 @@ async def agentic_retrieval(
 
     except Exception as e:
         logger.error(f"Sufficiency check failed: {e}, assuming sufficient")
-        metadata["total_latency_ms"] = (time.time() - start_time) * 1000
+        metadata["total_latency_ms"] = (time.perf_counter() - start_time) * 1000
         return round1_results, metadata
 
     # ========== If sufficient: return original Round 1 Top 20 ==========
@@ -678,7 +896,7 @@ async def agentic_retrieval(
 
         final_results = round1_results
         metadata["final_count"] = len(final_results)
-        metadata["total_latency_ms"] = (time.time() - start_time) * 1000
+        metadata["total_latency_ms"] = (time.perf_counter() - start_time) * 1000
 
         logger.info(f"Complete: Latency {metadata['total_latency_ms']:.0f}ms")
         return final_results, metadata
@@ -733,6 +951,8 @@ async def agentic_retrieval(
             bm25_top_n=config.round1_bm25_top_n,
             final_top_n=config.round2_per_query_top_n,
             rrf_k=60,
+            embedding_index=embedding_index,
+            bm25_index=bm25_index,
         )
 
         metadata["round2_count"] = len(round2_results)
@@ -745,7 +965,7 @@ async def agentic_retrieval(
 
     except Exception as e:
         logger.error(f"Round 2 failed: {e}, using Round 1 results")
-        metadata["total_latency_ms"] = (time.time() - start_time) * 1000
+        metadata["total_latency_ms"] = (time.perf_counter() - start_time) * 1000
         return round1_results, metadata
 
     # ========== Merge: ensure total 40 documents ==========
@@ -790,7 +1010,7 @@ async def agentic_retrieval(
         logger.info(f"No Rerank: Returning Top {len(final_results)}")
 
     metadata["final_count"] = len(final_results)
-    metadata["total_latency_ms"] = (time.time() - start_time) * 1000
+    metadata["total_latency_ms"] = (time.perf_counter() - start_time) * 1000
 
     logger.info(
         f"Complete: Final {len(final_results)} docs | Latency {metadata['total_latency_ms']:.0f}ms"
@@ -200,13 +200,18 @@ class BaseVectorizeService(VectorizeServiceInterface):
             response = await self._make_request(texts, instruction, is_query)
             return self._parse_embeddings_response(response)
 
+        # Sub-batches are sent concurrently; _make_request bounds the number in
+        # flight with max_concurrent_requests, and gather keeps input order
+        step = self.config.batch_size
+        responses = await asyncio.gather(
+            *(
+                self._make_request(texts[i : i + step], instruction, is_query)
+                for i in range(0, len(texts), step)
+            )
+        )
         embeddings = []
-        for i in range(0, len(texts), self.config.batch_size):
-            batch_texts = texts[i : i + self.config.batch_size]
-            response = await self._make_request(batch_texts, instruction, is_query)
+        for response in responses:
             embeddings.extend(self._parse_embeddings_response(response))
-            if i + self.config.batch_size < len(texts):
-                await asyncio.sleep(0.1)
         return embeddings
 
     async def get_embeddings_batch(
@@ -11,10 +11,13 @@ Usage:
     embedding = await service.get_embedding("Hello world")  # Auto-fallback
 """
 
+import asyncio
+import hashlib
 import logging
 import os
 import time
-from typing import Optional, List, Tuple
+from collections import OrderedDict
+from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass, field
 import numpy as np
 
@@ -62,6 +65,9 @@ class HybridVectorizeConfig:
     encoding_format: str = "float"
     dimensions: int = 1024
 
+    # Single-text embeddings kept in memory (LRU); 0 disables the cache
+    embedding_cache_size: int = 1024
+
     # Fallback behavior
     enable_fallback: bool = True
     max_primary_failures: int = 3
@@ -95,6 +101,9 @@ class HybridVectorizeConfig:
         )
         self.encoding_format = os.getenv("VECTORIZE_ENCODING_FORMAT", self.encoding_format)
         self.dimensions = int(os.getenv("VECTORIZE_DIMENSIONS", str(self.dimensions)))
+        self.embedding_cache_size = int(
+            os.getenv("VECTORIZE_EMBEDDING_CACHE_SIZE", str(self.embedding_cache_size))
+        )
 
         # Fallback behavior
         # Enable fallback only if:
@@ -232,6 +241,11 @@ class HybridVectorizeService(VectorizeServiceInterface):
                 dimensions=config.dimensions,
             )
 
+        # Embeddings keyed by sha256(model, instruction, is_query, text), plus
+        # in-flight requests so concurrent identical texts share one call
+        self._embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._pending_embeddings: Dict[str, asyncio.Task] = {}
+
         logger.info(
             f"Initialized HybridVectorizeService | "
             f"primary={config.primary_provider} | "
@@ -256,7 +270,36 @@ class HybridVectorizeService(VectorizeServiceInterface):
     async def get_embedding(
         self, text: str, instruction: Optional[str] = None, is_query: bool = False
     ) -> np.ndarray:
-        """Get embedding for a single text with automatic fallback"""
+        """Get embedding for a single text with automatic fallback
+        
+        Results are cached in memory, so a text embedded again (e.g. the same
+        query searched across several memory types) skips the remote call.
+        """
+        if self.config.embedding_cache_size <= 0:
+            return await self._fetch_embedding(text, instruction, is_query)
+
+        key = self._embedding_cache_key(text, instruction, is_query)
+        cached = self._embedding_cache.get(key)
+        if cached is not None:
+            self._embedding_cache.move_to_end(key)
+            return cached.copy()
+
+        task = self._pending_embeddings.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._fetch_and_cache_embedding(key, text, instruction, is_query)
+            )
+            self._pending_embeddings[key] = task
+            task.add_done_callback(lambda _: self._pending_embeddings.pop(key, None))
+
+        # Shielded: one caller being cancelled must not cancel the shared request
+        embedding = await asyncio.shield(task)
+        return embedding.copy()
+    
+    async def _fetch_embedding(
+        self, text: str, instruction: Optional[str], is_query: bool
+    ) -> np.ndarray:
+        """Embed a single text (uncached) with automatic fallback"""
         return await self.execute_with_fallback(
             "get_embedding",
             lambda: self.primary_service.get_embedding(text, instruction, is_query),
@@ -264,6 +307,26 @@ class HybridVectorizeService(VectorizeServiceInterface):
             batch_size=1,
         )
     
+    async def _fetch_and_cache_embedding(
+        self, key: str, text: str, instruction: Optional[str], is_query: bool
+    ) -> np.ndarray:
+        """Embed a text and store it in the LRU cache"""
+        embedding = await self._fetch_embedding(text, instruction, is_query)
+        self._embedding_cache[key] = embedding
+        while len(self._embedding_cache) > self.config.embedding_cache_size:
+            self._embedding_cache.popitem(last=False)
+        return embedding
+    
+    def _embedding_cache_key(
+        self, text: str, instruction: Optional[str], is_query: bool
+    ) -> str:
+        """Cache key for a single-text embedding request"""
+        digest = hashlib.sha256()
+        for part in (self.config.model, instruction or "", str(is_query), text):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+    
     async def get_embedding_with_usage(
         self, text: str, instruction: Optional[str] = None, is_query: bool = False
     ) -> Tuple[np.ndarray, Optional[UsageInfo]]:
@@ -9,6 +9,7 @@ This module contains the following features:
 4. Status table operation functions: Manage the lifecycle of conversation status
 """
 
+import asyncio
 import time
 from api_specs.dtos import MemorizeRequest
 from api_specs.memory_types import MemCell, RawDataType
@@ -747,6 +748,20 @@ def _convert_profile_data_to_core_format(profile_memory: ProfileMemory) -> CoreM
     }
 
 
+def _to_string(value: Any) -> str:
+    """Convert a raw message field value to the string stored in the document"""
+    if value is None:
+        return ''
+    elif isinstance(value, str):
+        return value
+    elif isinstance(value, datetime):
+        return value.isoformat()
+    elif isinstance(value, list):
+        return ','.join(str(item) for item in value) if value else ''
+    else:
+        return str(value)
+
+
 def _convert_memcell_to_document(
     memcell: MemCell, current_time: Optional[datetime] = None
 ) -> DocMemCell:
@@ -777,41 +792,28 @@ def _convert_memcell_to_document(
             for raw_data_dict in memcell.original_data:
                 # Actual data structure is: {'speaker_id': 'user_1', 'speaker_name': 'Alice', 'content': 'message content', 'timestamp': '...'}
                 # Here content is the direct message string, not a nested dict
-                # Helper function: convert various types to string
-                def to_string(value):
-                    if value is None:
-                        return ''
-                    elif isinstance(value, str):
-                        return value
-                    elif isinstance(value, datetime):
-                        return value.isoformat()
-                    elif isinstance(value, list):
-                        return ','.join(str(item) for item in value) if value else ''
-                    else:
-                        return str(value)
-
                 message = {
                     "content": raw_data_dict.get('content')
                     or '',  # Handle None content explicitly
                     "extend": {
-                        "speaker_id": to_string(raw_data_dict.get('speaker_id', '')),
-                        "speaker_name": to_string(
+                        "speaker_id": _to_string(raw_data_dict.get('speaker_id', '')),
+                        "speaker_name": _to_string(
                             raw_data_dict.get('speaker_name', '')
                         ),
-                        "timestamp": to_string(
+                        "timestamp": _to_string(
                             _convert_timestamp_to_time(
                                 raw_data_dict.get('timestamp', '')
                             )
                         ),
-                        "message_id": to_string(raw_data_dict.get('data_id', '')),
-                        "receiverId": to_string(raw_data_dict.get('receiverId', '')),
-                        "roomId": to_string(raw_data_dict.get('roomId', '')),
-                        "userIdList": to_string(raw_data_dict.get('userIdList', [])),
-                        "createBy": to_string(raw_data_dict.get('createBy', '')),
-                        "updateTime": to_string(raw_data_dict.get('updateTime', '')),
-                        "msgType": to_string(raw_data_dict.get('msgType', '')),
-                        "referList": to_string(raw_data_dict.get('referList', [])),
-                        "orgId": to_string(raw_data_dict.get('orgId', '')),
+                        "message_id": _to_string(raw_data_dict.get('data_id', '')),
+                        "receiverId": _to_string(raw_data_dict.get('receiverId', '')),
+                        "roomId": _to_string(raw_data_dict.get('roomId', '')),
+                        "userIdList": _to_string(raw_data_dict.get('userIdList', [])),
+                        "createBy": _to_string(raw_data_dict.get('createBy', '')),
+                        "updateTime": _to_string(raw_data_dict.get('updateTime', '')),
+                        "msgType": _to_string(raw_data_dict.get('msgType', '')),
+                        "referList": _to_string(raw_data_dict.get('referList', [])),
+                        "orgId": _to_string(raw_data_dict.get('orgId', '')),
                     },
                 }
 
@@ -950,8 +952,11 @@ async def _save_memcell_to_database(
     try:
         # Initialize MemCell Repository
         memcell_repo = get_bean_by_type(MemCellRawRepository)
-        # Convert business layer MemCell to document model
-        doc_memcell = _convert_memcell_to_document(memcell, current_time)
+        # Convert business layer MemCell to document model. This walks every
+        # raw message and validates the document, so run it off the event loop
+        doc_memcell = await asyncio.to_thread(
+            _convert_memcell_to_document, memcell, current_time
+        )
 
         # Check if conversion was successful
         if doc_memcell is None:
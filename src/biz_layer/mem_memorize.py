@@ -1099,6 +1099,26 @@ async def save_personal_profile_memory(
         # Remove individual operation success log
 
 
+async def _index_episodic_memory(
+    saved_doc: Any,
+    episodic_es_repo: EpisodicMemoryEsRepository,
+    episodic_milvus_repo: EpisodicMemoryMilvusRepository,
+) -> None:
+    """Write a saved episodic memory to Elasticsearch and Milvus"""
+    es_doc = EpisodicMemoryConverter.from_mongo(saved_doc)
+    await episodic_es_repo.create(es_doc)
+
+    milvus_entity = EpisodicMemoryMilvusConverter.from_mongo(saved_doc)
+    vector = milvus_entity.get("vector") if isinstance(milvus_entity, dict) else None
+    if vector and len(vector) > 0:
+        await episodic_milvus_repo.insert(milvus_entity, flush=False)
+    else:
+        logger.warning(
+            "[mem_memorize] Skipping write to Milvus: vector empty or missing, event_id=%s",
+            getattr(saved_doc, "event_id", None),
+        )
+
+
 async def save_memory_docs(
     doc_payloads: List[MemoryDocPayload], version: Optional[str] = None
 ) -> Dict[MemoryType, List[Any]]:
@@ -1121,24 +1141,25 @@ async def save_memory_docs(
         episodic_milvus_repo = get_bean_by_type(EpisodicMemoryMilvusRepository)
         saved_episodic: List[Any] = []
 
-        for doc in episodic_docs:
-            saved_doc = await episodic_repo.append_episodic_memory(doc)
-            saved_episodic.append(saved_doc)
-
-            es_doc = EpisodicMemoryConverter.from_mongo(saved_doc)
-            await episodic_es_repo.create(es_doc)
-
-            milvus_entity = EpisodicMemoryMilvusConverter.from_mongo(saved_doc)
-            vector = (
-                milvus_entity.get("vector") if isinstance(milvus_entity, dict) else None
-            )
-            if vector and len(vector) > 0:
-                await episodic_milvus_repo.insert(milvus_entity, flush=False)
-            else:
-                logger.warning(
-                    "[mem_memorize] Skipping write to Milvus: vector empty or missing, event_id=%s",
-                    getattr(saved_doc, "event_id", None),
+        # MongoDB appends stay sequential; each saved document is indexed into
+        # ES/Milvus in the background while the next one is being written
+        index_tasks: List[asyncio.Task] = []
+        try:
+            for doc in episodic_docs:
+                saved_doc = await episodic_repo.append_episodic_memory(doc)
+                saved_episodic.append(saved_doc)
+                index_tasks.append(
+                    asyncio.create_task(
+                        _index_episodic_memory(
+                            saved_doc, episodic_es_repo, episodic_milvus_repo
+                        )
+                    )
                 )
+        finally:
+            index_results = await asyncio.gather(*index_tasks, return_exceptions=True)
+        for index_result in index_results:
+            if isinstance(index_result, BaseException):
+                raise index_result
 
         saved_result[MemoryType.EPISODIC_MEMORY] = saved_episodic
 
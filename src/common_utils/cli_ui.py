@@ -443,14 +443,15 @@ class CLIUI:
         left = f"{self.box.v}{' ' * self.padding}"
         right = f"{' ' * self.padding}{self.box.v}"
 
-        # Print with margin
+        # Assemble the whole box and emit it in a single write
         prefix = " " * self.margin
-        print(prefix + top)
+        rows = [prefix + top]
         for line in content_lines:
             line = truncate_to_width(line, inner_w)
             pad = inner_w - visible_width(_strip_ansi(line))
-            print(prefix + left + line + (" " * pad) + right)
-        print(prefix + bottom)
+            rows.append(prefix + left + line + (" " * pad) + right)
+        rows.append(prefix + bottom)
+        sys.stdout.write("\n".join(rows) + "\n")
 
     # ------------------------ Tables --------------------------------------
     def table(
@@ -71,13 +71,8 @@ def to_iso_format(
     if value_type is str:
         if not time_value:
             return None
-        # Validate and parse ISO format string
-        time_str = (
-            time_value.replace("Z", "+00:00")
-            if time_value.endswith("Z")
-            else time_value
-        )
-        dt = datetime.datetime.fromisoformat(time_str)
+        # Validate and parse ISO format string ("Z" suffix is accepted natively)
+        dt = datetime.datetime.fromisoformat(time_value)
     elif value_type in (int, float):
         if time_value <= 0:
             raise ValueError(f"Invalid timestamp: {time_value}. Must be positive.")
@@ -178,12 +173,8 @@ def _parse_datetime_core(
     if isinstance(time_value, datetime.datetime):
         dt = time_value
     elif isinstance(time_value, str):
-        time_str = time_value.strip()
-        # Handle "Z" suffix (UTC)
-        if time_str.endswith("Z"):
-            time_str = time_str[:-1] + "+00:00"
-        # Python 3.11+ fromisoformat supports space-separated format
-        dt = datetime.datetime.fromisoformat(time_str)
+        # Python 3.11+ fromisoformat accepts the "Z" suffix and space separator
+        dt = datetime.datetime.fromisoformat(time_value.strip())
     else:
         # Other types: convert to string first
         time_str = str(time_value).strip()
@@ -193,13 +184,12 @@ def _parse_datetime_core(
 
     # Add timezone if naive
     if dt.tzinfo is None:
-        tz = target_timezone or get_timezone()
-        dt_localized = dt.replace(tzinfo=tz)
+        dt_localized = dt.replace(tzinfo=target_timezone or timezone)
     else:
         dt_localized = dt
 
     # Convert to system timezone
-    return dt_localized.astimezone(get_timezone())
+    return dt_localized.astimezone(timezone)
 
 
 def from_iso_format(
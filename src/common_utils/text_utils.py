@@ -4,7 +4,7 @@ Text processing utility module
 Provides general-purpose utility functions for text processing, including smart truncation, formatting, and other features.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
 from enum import Enum
 from dataclasses import dataclass
 
@@ -472,3 +472,54 @@ def clean_whitespace(text: str) -> str:
 
     # Strip leading and trailing whitespace
     return ''.join(result_parts).strip()
+
+
+def iter_json_objects(text: str) -> Iterator[str]:
+    """
+    Yield the balanced JSON object candidates in text (e.g. LLM output), in order
+
+    Each candidate is a `{...}` substring whose braces balance, ignoring braces
+    inside string literals. Scanning resumes after each candidate, so callers
+    can skip objects that do not parse or are not the one they want. An
+    opening brace that is never closed is skipped and scanning resumes at the
+    next one.
+
+    Args:
+        text: Text that may contain JSON objects among other content
+
+    Yields:
+        str: Candidate `{...}` substrings (not guaranteed to be valid JSON)
+    """
+    start = text.find("{") if text else -1
+    while start >= 0:
+        end = _find_closing_brace(text, start)
+        if end is None:
+            start = text.find("{", start + 1)
+        else:
+            yield text[start : end + 1]
+            start = text.find("{", end + 1)
+
+
+def _find_closing_brace(text: str, start: int) -> Optional[int]:
+    """Return the index of the brace closing the one at `start`, or None"""
+    depth = 0
+    in_string = False
+    escape = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+    return None
@@ -10,6 +10,7 @@ from contextlib import asynccontextmanager
 from typing import Optional, TypeVar, Generic, Type, Union, List
 from beanie import PydanticObjectId
 from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.errors import BulkWriteError
 from core.observation.logger import get_logger
 from core.oxm.mongo.document_base import DocumentBase
 
@@ -230,6 +231,9 @@ class BaseRepository(ABC, Generic[T]):
         """
         Batch create documents
 
+        Documents are inserted unordered, so the server does not stop at the
+        first rejected document and can apply the rest of the batch.
+
         Args:
             documents: List of documents
             session: Optional MongoDB session, used for transaction support
@@ -240,7 +244,9 @@ class BaseRepository(ABC, Generic[T]):
         try:
             # Beanie's insert_many does not automatically update the id attribute of input objects
             # We need to manually retrieve inserted_ids from the returned InsertManyResult and set them
-            result = await self.model.insert_many(documents, session=session)
+            result = await self.model.insert_many(
+                documents, session=session, ordered=False
+            )
             # Set the _id generated by MongoDB back to the id attribute of each document object
             for doc, inserted_id in zip(documents, result.inserted_ids):
                 doc.id = inserted_id
@@ -250,6 +256,16 @@ class BaseRepository(ABC, Generic[T]):
                 len(documents),
             )
             return documents
+        except BulkWriteError as e:
+            rejected = [err.get("index") for err in e.details.get("writeErrors", [])]
+            logger.error(
+                "❌ Batch create rejected documents [%s]: %d/%d at indices %s",
+                self.model_name,
+                len(rejected),
+                len(documents),
+                rejected,
+            )
+            raise
         except Exception as e:
             logger.error(
                 "❌ Failed to batch create documents [%s]: %s", self.model_name, e
@@ -163,8 +163,8 @@ class MsgGroupQueueManager:
             total_queues=num_queues, total_current_messages=0
         )
 
-        # Async lock to protect statistics
-        self._stats_lock = asyncio.Lock()
+        # Statistics are only updated in synchronous sections (no await in
+        # between), so the event loop already serializes them without a lock
 
         # Start time
         self._start_time = time.time()
@@ -228,8 +228,7 @@ class MsgGroupQueueManager:
             can_deliver, reject_reason = self._can_deliver_message()
             if not can_deliver:
                 # Reject delivery
-                async with self._stats_lock:
-                    self._manager_stats.total_rejected_messages += 1
+                self._manager_stats.total_rejected_messages += 1
 
                 logger.warning(
                     "❌ MsgGroupQueueManager[%s] Delivery rejected: group_key=%s, reason=%s",
@@ -247,19 +246,18 @@ class MsgGroupQueueManager:
             current_time = to_iso_format(get_now_with_timezone())
             timestamp = time.time()
 
-            async with self._stats_lock:
-                self._queue_stats[target_queue_id].current_size = target_queue.qsize()
-                self._queue_stats[target_queue_id].total_delivered += 1
-                self._queue_stats[target_queue_id].last_deliver_time = current_time
+            self._queue_stats[target_queue_id].current_size = target_queue.qsize()
+            self._queue_stats[target_queue_id].total_delivered += 1
+            self._queue_stats[target_queue_id].last_deliver_time = current_time
 
-                self._manager_stats.total_delivered_messages += 1
-                self._manager_stats.total_current_messages = (
-                    self._get_total_current_messages()
-                )
+            self._manager_stats.total_delivered_messages += 1
+            self._manager_stats.total_current_messages = (
+                self._get_total_current_messages()
+            )
 
-                # Record time window events
-                self._delivery_events[target_queue_id].append(timestamp)
-                self._manager_delivery_events.append(timestamp)
+            # Record time window events
+            self._delivery_events[target_queue_id].append(timestamp)
+            self._manager_delivery_events.append(timestamp)
 
             logger.debug(
                 "✅ MsgGroupQueueManager[%s] Message delivered successfully: group_key=%s -> queue_id=%d, queue current size=%d, total remaining=%d",
@@ -322,19 +320,18 @@ class MsgGroupQueueManager:
             current_time = to_iso_format(get_now_with_timezone())
             timestamp = time.time()
 
-            async with self._stats_lock:
-                self._queue_stats[queue_id].current_size = target_queue.qsize()
-                self._queue_stats[queue_id].total_consumed += 1
-                self._queue_stats[queue_id].last_consume_time = current_time
+            self._queue_stats[queue_id].current_size = target_queue.qsize()
+            self._queue_stats[queue_id].total_consumed += 1
+            self._queue_stats[queue_id].last_consume_time = current_time
 
-                self._manager_stats.total_consumed_messages += 1
-                self._manager_stats.total_current_messages = (
-                    self._get_total_current_messages()
-                )
+            self._manager_stats.total_consumed_messages += 1
+            self._manager_stats.total_current_messages = (
+                self._get_total_current_messages()
+            )
 
-                # Record time window events
-                self._consume_events[queue_id].append(timestamp)
-                self._manager_consume_events.append(timestamp)
+            # Record time window events
+            self._consume_events[queue_id].append(timestamp)
+            self._manager_consume_events.append(timestamp)
 
             group_key, _ = message_tuple
             logger.debug(
@@ -376,22 +373,21 @@ class MsgGroupQueueManager:
         Returns:
             Union[Dict, List[Dict]]: Queue info dictionary or list of queue info
         """
-        async with self._stats_lock:
-            # Update current queue sizes
-            for i, queue in enumerate(self._queues):
-                self._queue_stats[i].current_size = queue.qsize()
-
-            # Update time window statistics
-            self._update_time_window_stats()
-
-            if queue_id is not None:
-                if queue_id < 0 or queue_id >= self.num_queues:
-                    raise ValueError(
-                        f"Queue ID out of range: {queue_id}, valid range: 0-{self.num_queues-1}"
-                    )
-                return self._queue_stats[queue_id].to_dict()
-            else:
-                return [stat.to_dict() for stat in self._queue_stats]
+        # Update current queue sizes
+        for i, queue in enumerate(self._queues):
+            self._queue_stats[i].current_size = queue.qsize()
+
+        # Update time window statistics
+        self._update_time_window_stats()
+
+        if queue_id is not None:
+            if queue_id < 0 or queue_id >= self.num_queues:
+                raise ValueError(
+                    f"Queue ID out of range: {queue_id}, valid range: 0-{self.num_queues-1}"
+                )
+            return self._queue_stats[queue_id].to_dict()
+        else:
+            return [stat.to_dict() for stat in self._queue_stats]
 
     async def get_manager_stats(self) -> Dict[str, Any]:
         """
@@ -400,17 +396,16 @@ class MsgGroupQueueManager:
         Returns:
             Dict[str, Any]: Manager statistics
         """
-        async with self._stats_lock:
-            # Update uptime and total current message count
-            self._manager_stats.uptime_seconds = time.time() - self._start_time
-            self._manager_stats.total_current_messages = (
-                self._get_total_current_messages()
-            )
+        # Update uptime and total current message count
+        self._manager_stats.uptime_seconds = time.time() - self._start_time
+        self._manager_stats.total_current_messages = (
+            self._get_total_current_messages()
+        )
 
-            # Update time window statistics
-            self._update_time_window_stats()
+        # Update time window statistics
+        self._update_time_window_stats()
 
-            return self._manager_stats.to_dict()
+        return self._manager_stats.to_dict()
 
     async def get_summary(self) -> Dict[str, Any]:
         """
@@ -11,6 +11,7 @@ Design:
 """
 
 import asyncio
+import math
 import numpy as np
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
@@ -265,13 +266,11 @@ class ClusterManager:
         if not state.cluster_centroids:
             return None
         
-        best_similarity = -1.0
-        best_cluster_id = None
-        
-        vector_norm = np.linalg.norm(vector) + 1e-9
-        
+        # Collect the centroids eligible under the time constraint
+        cluster_ids: List[str] = []
+        centroids: List[np.ndarray] = []
         for cluster_id, centroid in state.cluster_centroids.items():
-            if centroid is None or centroid.size == 0:
+            if centroid is None or centroid.shape != vector.shape:
                 continue
             
             # Check time constraint
@@ -282,16 +281,22 @@ class ClusterManager:
                     if time_diff > self.config.max_time_gap_seconds:
                         continue
             
-            # Compute cosine similarity
-            centroid_norm = np.linalg.norm(centroid) + 1e-9
-            similarity = float((centroid @ vector) / (centroid_norm * vector_norm))
-            
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_cluster_id = cluster_id
+            cluster_ids.append(cluster_id)
+            centroids.append(centroid)
+        
+        if not cluster_ids:
+            return None
+        
+        # Cosine similarity against all centroids with a single matrix product
+        matrix = np.stack(centroids)
+        vector_norm = math.sqrt(float(np.dot(vector, vector))) + 1e-9
+        centroid_norms = np.linalg.norm(matrix, axis=1) + 1e-9
+        similarities = (matrix @ vector) / (centroid_norms * vector_norm)
         
-        if best_similarity >= self.config.similarity_threshold:
-            return best_cluster_id
+        # argmax keeps the first of equal scores, like the strict ">" scan did
+        best = int(np.argmax(similarities))
+        if float(similarities[best]) >= self.config.similarity_threshold:
+            return cluster_ids[best]
         
         return None
     
@@ -1,4 +1,5 @@
 import os
+from typing import AsyncIterator
 from memory_layer.llm.openai_provider import OpenAIProvider
 
 
@@ -24,3 +25,11 @@ class LLMProvider:
         return await self.provider.generate(
             prompt, temperature, max_tokens, extra_body, response_format
         )
+
+    def stream_with_messages(
+        self,
+        messages: list[dict],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[str]:
+        return self.provider.stream_with_messages(messages, temperature, max_tokens)
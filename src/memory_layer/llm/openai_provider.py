@@ -12,7 +12,7 @@ import urllib.request
 import urllib.parse
 import urllib.error
 import aiohttp
-from typing import Optional
+from typing import AsyncIterator, Optional
 import asyncio
 import random
 
@@ -222,6 +222,116 @@ class OpenAIProvider(LLMProvider):
                 if retry_num == max_retries - 1:
                     raise LLMError(f"Request failed: {str(e)}")
 
+    async def stream_with_messages(
+        self,
+        messages: list[dict],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion for the given messages.
+
+        Like ``generate``, the request is retried (with the same 429 backoff)
+        until a 200 response arrives. Nothing has been yielded before that;
+        failures while streaming are not retried, since a retry would
+        duplicate content the caller has already received.
+
+        Args:
+            messages: Chat messages (``role``/``content`` dicts)
+            temperature: Override temperature for this request
+            max_tokens: Override max tokens for this request
+
+        Yields:
+            Content deltas in the order they are received
+
+        Raises:
+            LLMError: If the request fails
+        """
+        start_time = time.perf_counter()
+        data = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature if temperature is not None else self.temperature,
+            "stream": True,
+        }
+        if os.getenv("LLM_OPENROUTER_PROVIDER", "default") != "default":
+            provider_list = [
+                p.strip() for p in os.getenv('LLM_OPENROUTER_PROVIDER').split(',')
+            ]
+            data["provider"] = {"order": provider_list, "allow_fallbacks": False}
+        if max_tokens is not None:
+            data["max_tokens"] = max_tokens
+        elif self.max_tokens is not None:
+            data["max_tokens"] = self.max_tokens
+
+        headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {self.api_key}',
+        }
+        max_retries = 5
+        try:
+            timeout = aiohttp.ClientTimeout(total=600)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                for retry_num in range(max_retries):
+                    try:
+                        response = await session.post(
+                            f"{self.base_url}/chat/completions",
+                            json=data,
+                            headers=headers,
+                        )
+                        if response.status == 200:
+                            break
+                        async with response:
+                            body = await response.text()
+                        try:
+                            error_msg = json.loads(body).get('error', {}).get(
+                                'message', f"HTTP {response.status}"
+                            )
+                        except (ValueError, AttributeError):
+                            error_msg = f"HTTP {response.status}"
+                        logger.error(
+                            f"❌ [OpenAI-{self.model}] HTTP error {response.status}:"
+                        )
+                        logger.error(f"   💬 Error message: {error_msg}")
+                        if response.status == 429:
+                            logger.warning(
+                                f"429 Too Many Requests, waiting for 10 seconds"
+                            )
+                            await asyncio.sleep(random.randint(5, 20))
+                        failure = f"HTTP Error {response.status}: {error_msg}"
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        logger.error("%s: %s", type(e).__name__, e)
+                        failure = f"Request failed: {str(e) or type(e).__name__}"
+                    logger.error(f"retry_num: {retry_num}")
+                    if retry_num == max_retries - 1:
+                        raise LLMError(failure)
+
+                # Server-sent events: one "data: {...}" payload per line
+                async with response:
+                    async for raw_line in response.content:
+                        line = raw_line.strip()
+                        if not line.startswith(b"data:"):
+                            continue
+                        payload = line[5:].strip()
+                        if payload == b"[DONE]":
+                            break
+                        try:
+                            event = json.loads(payload)
+                        except ValueError as e:
+                            raise LLMError(f"Malformed stream event: {e}") from e
+                        choices = event.get('choices') or [{}]
+                        content = (choices[0].get('delta') or {}).get('content')
+                        if content:
+                            yield content
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("%s: %s", type(e).__name__, e)
+            raise LLMError(f"Request failed: {str(e) or type(e).__name__}") from e
+
+        logger.debug(
+            f"[OpenAI-{self.model}] Stream completed in "
+            f"{time.perf_counter() - start_time:.2f}s"
+        )
+
     async def test_connection(self) -> bool:
         """
         Test the connection to the OpenRouter API.
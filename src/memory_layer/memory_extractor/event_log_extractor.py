@@ -8,11 +8,11 @@ Each event log contains a time and a list of atomic facts extracted from the epi
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import json
-import re
 
 from memory_layer.prompts import get_prompt_by
 from memory_layer.llm.llm_provider import LLMProvider
 from common_utils.datetime_utils import get_now_with_timezone, from_iso_format
+from common_utils.text_utils import iter_json_objects
 from api_specs.memory_types import EventLog, MemoryType, MemCell
 
 from core.observation.logger import get_logger
@@ -128,17 +128,15 @@ class EventLogExtractor:
                 except json.JSONDecodeError:
                     pass
 
-        # 3. Try extracting JSON object containing event_log
-        json_match = re.search(
-            r'\{[^{}]*"event_log"[^{}]*\{[^{}]*"time"[^{}]*"atomic_fact"[^{}]*\}[^{}]*\}',
-            response,
-            re.DOTALL,
-        )
-        if json_match:
+        # 3. Try the balanced JSON objects in the text, in order, until one
+        #    holds an event_log (stray prose like `{note}` is skipped)
+        for json_str in iter_json_objects(response):
             try:
-                return json.loads(json_match.group())
+                data = json.loads(json_str)
             except json.JSONDecodeError:
-                pass
+                continue
+            if isinstance(data, dict) and "event_log" in data:
+                return data
 
         # 4. Try parsing entire response directly
         try:
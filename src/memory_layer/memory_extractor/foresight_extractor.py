@@ -4,6 +4,7 @@ Generate predictions of potential impacts on user's future life and decisions fr
 """
 
 import json
+import re
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
@@ -20,6 +21,9 @@ from common_utils.datetime_utils import get_now_with_timezone
 
 logger = get_logger(__name__)
 
+_NON_DATE_CHARS_RE = re.compile(r'[^\d\-]')
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
 
 class ForesightExtractor(MemoryExtractor):
     """
@@ -176,13 +180,11 @@ class ForesightExtractor(MemoryExtractor):
         if not date_str or not isinstance(date_str, str):
             return None
 
-        import re
-
         # Keep only digits and hyphens, remove other characters (e.g., Chinese, spaces, etc.)
-        cleaned = re.sub(r'[^\d\-]', '', date_str)
+        cleaned = _NON_DATE_CHARS_RE.sub('', date_str)
 
         # Validate format is YYYY-MM-DD
-        if not re.match(r'^\d{4}-\d{2}-\d{2}$', cleaned):
+        if not _ISO_DATE_RE.match(cleaned):
             logger.warning(
                 f"Invalid time format, does not match YYYY-MM-DD: original='{date_str}', cleaned='{cleaned}'"
             )
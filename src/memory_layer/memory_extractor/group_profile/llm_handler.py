@@ -215,7 +215,7 @@ class GroupProfileLLMHandler:
         # Build speaker info (requires help from data_processor, extract from conversation_text here)
         # Extract current speakers from conversation
         current_speakers = set()
-        for line in conversation_text.split('\n'):
+        for line in conversation_text.splitlines():
             match = re.search(r'\(user_id:([^)]+)\):', line)
             if match:
                 speaker_id = match.group(1).strip()
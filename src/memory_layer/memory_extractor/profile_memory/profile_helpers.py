@@ -22,25 +22,32 @@ from memory_layer.memory_extractor.profile_memory.value_helpers import (
 logger = get_logger(__name__)
 
 
+# Keys dropped from the top level of a profile; nested dicts only drop evidences
+_PROMPT_EXCLUDED_KEYS = frozenset({"evidences", "output_reasoning"})
+
+
 def remove_evidences_from_profile(profile_obj: Dict[str, Any]) -> Dict[str, Any]:
-    """Recursively remove evidence fields to keep prompts concise."""
-
-    def strip_content(content: Any) -> Any:
-        if isinstance(content, dict):
-            return {
-                key: strip_content(value)
-                for key, value in content.items()
-                if key != "evidences"
-            }
-        if isinstance(content, list):
-            return [strip_content(item) for item in content]
-        return content
-
-    result: Dict[str, Any] = {}
-    for key, value in profile_obj.items():
-        if key in {"evidences", "output_reasoning"}:
-            continue
-        result[key] = strip_content(value)
+    """Remove evidence fields at every depth to keep prompts concise.
+
+    Uses an explicit worklist rather than recursion. Copies are created with
+    their keys pre-inserted so the original key order is preserved.
+    """
+    result: Dict[str, Any] = {
+        key: None for key in profile_obj if key not in _PROMPT_EXCLUDED_KEYS
+    }
+    # (copy to fill, key or index in it, source value)
+    stack: List[tuple] = [(result, key, profile_obj[key]) for key in result]
+    while stack:
+        parent, slot, value = stack.pop()
+        if isinstance(value, dict):
+            copied: Any = {key: None for key in value if key != "evidences"}
+            stack.extend((copied, key, value[key]) for key in copied)
+        elif isinstance(value, list):
+            copied = [None] * len(value)
+            stack.extend((copied, index, item) for index, item in enumerate(value))
+        else:
+            copied = value
+        parent[slot] = copied
     return result
 
 
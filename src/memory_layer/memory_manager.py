@@ -97,7 +97,7 @@ class MemoryManager:
         Returns:
             (MemCell, StatusResult) or (None, StatusResult)
         """
-        now = time.time()
+        now = time.perf_counter()
 
         # Boundary detection + create MemCell
         logger.debug(
@@ -129,7 +129,7 @@ class MemoryManager:
         logger.info(
             f"[MemoryManager] ✅ MemCell created successfully: "
             f"event_id={memcell.event_id}, "
-            f"elapsed time: {time.time() - now:.2f} seconds"
+            f"elapsed time: {time.perf_counter() - now:.2f} seconds"
         )
 
         return memcell, status_result
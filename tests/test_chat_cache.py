@@ -0,0 +1,18 @@
+"""Unit tests for the demo chat session caches."""
+
+from demo.chat.cache import RetrievalCache, normalize_query
+
+
+def test_normalize_query_ignores_case_whitespace_and_trailing_punctuation():
+    assert normalize_query("  What did   we DECIDE?? ") == "what did we decide"
+    assert normalize_query("我们决定了什么？") == "我们决定了什么"  # skip-i18n-check
+    assert normalize_query("why?") == normalize_query("Why")
+    assert normalize_query("?!") == ""
+
+
+def test_retrieval_cache_matches_near_identical_queries():
+    cache = RetrievalCache(capacity=4, min_similarity=0.5)
+    cache.put("What did we decide about the launch?", {"episodes": [1]})
+
+    assert cache.get("what did we decide about the launch") == {"episodes": [1]}
+    assert cache.get("Where is the office?") is None
@@ -0,0 +1,63 @@
+"""Unit tests for the demo chat NDJSON history log."""
+
+import json
+
+import pytest
+
+from demo.chat.session import ChatSession, _read_history_tail
+from demo.config import ChatModeConfig, ScenarioType
+from demo.ui import I18nTexts
+
+
+def _turn(i):
+    return {"user_input": f"q{i}", "assistant_response": f"a{i}"}
+
+
+def _write_log(path, records, tail=""):
+    path.write_text(
+        "".join(json.dumps(r) + "\n" for r in records) + tail, encoding="utf-8"
+    )
+
+
+def test_tail_skips_a_torn_last_line(tmp_path):
+    path = tmp_path / "g_2025-01-01_00-00.jsonl"
+    _write_log(path, [_turn(1), _turn(2)], tail='{"user_input": "q3", "assis')
+
+    assert _read_history_tail(path, 10) == [_turn(1), _turn(2)]
+
+
+def test_tail_stops_at_the_latest_clear_marker_and_respects_limit(tmp_path):
+    path = tmp_path / "g_2025-01-01_00-00.jsonl"
+    _write_log(
+        path, [_turn(1), {"cleared": True}, _turn(2), _turn(3), _turn(4)]
+    )
+
+    assert _read_history_tail(path, 10) == [_turn(2), _turn(3), _turn(4)]
+    assert _read_history_tail(path, 2) == [_turn(3), _turn(4)]
+    assert _read_history_tail(path, 0) == []
+
+
+@pytest.mark.asyncio
+async def test_resumed_log_with_torn_line_keeps_new_turns(tmp_path):
+    path = tmp_path / "g_2025-01-01_00-00.jsonl"
+    _write_log(path, [_turn(1)], tail='{"user_input": "q2", "assis')
+    session = ChatSession(
+        group_id="g",
+        config=ChatModeConfig(chat_history_dir=tmp_path),
+        llm_config=None,
+        scenario_type=ScenarioType.ASSISTANT,
+        retrieval_mode="rrf",
+        data_source="episode",
+        texts=I18nTexts("en"),
+    )
+
+    assert await session.load_conversation_history() == 1
+    session.conversation_history.append(("q3", "a3"))
+    session.schedule_history_save()
+    await session.wait_for_pending_save()
+
+    records = _read_history_tail(path, 10)
+    assert [(r["user_input"], r["assistant_response"]) for r in records] == [
+        ("q1", "a1"),
+        ("q3", "a3"),
+    ]
@@ -0,0 +1,36 @@
+"""Unit tests for the demo chat response rendering."""
+
+from demo.chat.ui import ChatUI, StructuredResponse
+from demo.ui import I18nTexts
+
+
+def test_structured_response_accepts_fenced_json():
+    raw = '```json\n{"answer": "Hello there", "confidence": "high"}\n```'
+
+    structured = StructuredResponse.from_json(raw)
+
+    assert structured is not None
+    assert structured.answer == "Hello there"
+    assert structured.confidence == "high"
+    assert StructuredResponse.from_json("Hello there") is None
+
+
+def test_streamed_response_is_not_repeated_as_raw_text(capsys):
+    texts = I18nTexts("en")
+
+    ChatUI.print_assistant_response("not json at all", texts, streamed=True)
+    assert "not json at all" not in capsys.readouterr().out
+
+    ChatUI.print_assistant_response("not json at all", texts)
+    assert "not json at all" in capsys.readouterr().out
+
+
+def test_streamed_fenced_response_shows_only_metadata(capsys):
+    texts = I18nTexts("en")
+    raw = '```json\n{"answer": "Hello there", "references": ["[1]"]}\n```'
+
+    ChatUI.print_assistant_response(raw, texts, streamed=True)
+
+    out = capsys.readouterr().out
+    assert "Hello there" not in out
+    assert "[1]" in out
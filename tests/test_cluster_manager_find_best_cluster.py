@@ -0,0 +1,51 @@
+"""Unit tests for ClusterManager centroid matching."""
+
+import numpy as np
+
+from memory_layer.cluster_manager.config import ClusterManagerConfig
+from memory_layer.cluster_manager.manager import ClusterManager, ClusterState
+
+
+def _state_with_centroids(centroids, last_ts=None):
+    state = ClusterState()
+    for cluster_id, centroid in centroids.items():
+        state.cluster_centroids[cluster_id] = np.asarray(centroid, dtype=np.float32)
+        state.cluster_counts[cluster_id] = 1
+        state.cluster_last_ts[cluster_id] = (last_ts or {}).get(cluster_id)
+    return state
+
+
+def _manager(**config):
+    manager = ClusterManager.__new__(ClusterManager)
+    manager.config = ClusterManagerConfig(**config)
+    return manager
+
+
+def test_returns_most_similar_centroid_above_threshold():
+    state = _state_with_centroids({"a": [1.0, 0.0], "b": [0.6, 0.8], "c": [0.0, 1.0]})
+    vector = np.array([0.5, 0.9], dtype=np.float32)
+
+    lenient = _manager(similarity_threshold=0.5)
+    strict = _manager(similarity_threshold=1.0)
+    assert lenient._find_best_cluster(state, vector, None) == "b"
+    assert strict._find_best_cluster(state, vector, None) is None
+
+
+def test_skips_stale_and_mismatched_centroids():
+    day = 24 * 60 * 60
+    state = _state_with_centroids(
+        {"stale": [1.0, 0.0], "wrong_dim": [1.0, 0.0, 0.0], "fresh": [0.7, 0.7]},
+        last_ts={"stale": 0.0, "fresh": 9 * day},
+    )
+    vector = np.array([1.0, 0.0], dtype=np.float32)
+    manager = _manager(similarity_threshold=0.5, max_time_gap_days=7.0)
+
+    assert manager._find_best_cluster(state, vector, 10 * day) == "fresh"
+    assert manager._find_best_cluster(state, vector, None) == "stale"
+
+
+def test_ties_resolve_to_first_cluster():
+    state = _state_with_centroids({"first": [1.0, 1.0], "second": [2.0, 2.0]})
+    vector = np.array([1.0, 1.0], dtype=np.float32)
+
+    assert _manager()._find_best_cluster(state, vector, None) == "first"
@@ -0,0 +1,18 @@
+"""Unit tests for the demo I18nTexts lookup and formatting."""
+
+from demo.ui import I18nTexts
+
+
+def test_formatting_distinguishes_equal_hashing_values():
+    texts = I18nTexts("en")
+
+    assert texts.get("retrieval_latency", latency=0) == "Retrieval latency: 0ms"
+    assert texts.get("retrieval_latency", latency=0.0) == "Retrieval latency: 0.0ms"
+    assert texts.get("retrieval_latency", latency=False) == "Retrieval latency: Falsems"
+
+
+def test_missing_key_and_missing_parameter_fall_back():
+    texts = I18nTexts("en")
+
+    assert texts.get("no_such_key") == "no_such_key"
+    assert texts.get("retrieval_latency", other=1) == texts.get("retrieval_latency")
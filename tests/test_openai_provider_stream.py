@@ -0,0 +1,80 @@
+"""Unit tests for OpenAIProvider.stream_with_messages against a local server."""
+
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from memory_layer.llm.openai_provider import OpenAIProvider
+from memory_layer.llm.protocol import LLMError
+
+
+async def _serve(handler):
+    app = web.Application()
+    app.router.add_post("/chat/completions", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def _collect(provider):
+    return [
+        chunk
+        async for chunk in provider.stream_with_messages(
+            [{"role": "user", "content": "hi"}]
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_retries_until_the_stream_starts():
+    attempts = []
+
+    async def handler(request):
+        attempts.append(request)
+        if len(attempts) < 3:
+            return web.json_response({"error": {"message": "busy"}}, status=503)
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for delta in ("Hel", "lo"):
+            await response.write(
+                b'data: {"choices": [{"delta": {"content": "%s"}}]}\n\n'
+                % delta.encode()
+            )
+        await response.write(b"data: [DONE]\n\n")
+        return response
+
+    runner, base_url = await _serve(handler)
+    try:
+        provider = OpenAIProvider(api_key="k", base_url=base_url)
+        assert await _collect(provider) == ["Hel", "lo"]
+        assert len(attempts) == 3
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_gives_up_with_llm_error_after_max_retries(monkeypatch):
+    attempts = []
+
+    async def handler(request):
+        attempts.append(request)
+        await asyncio.sleep(1)
+        return web.json_response({})
+
+    runner, base_url = await _serve(handler)
+    client_timeout = aiohttp.ClientTimeout
+    monkeypatch.setattr(
+        aiohttp, "ClientTimeout", lambda total: client_timeout(total=0.05)
+    )
+    try:
+        provider = OpenAIProvider(api_key="k", base_url=base_url)
+        with pytest.raises(LLMError, match="TimeoutError"):
+            await _collect(provider)
+        assert len(attempts) == 5
+    finally:
+        await runner.cleanup()
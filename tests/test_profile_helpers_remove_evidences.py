@@ -0,0 +1,48 @@
+"""Unit tests for remove_evidences_from_profile."""
+
+from memory_layer.memory_extractor.profile_memory.profile_helpers import (
+    remove_evidences_from_profile,
+)
+
+
+def test_strips_evidences_at_every_depth_and_keeps_key_order():
+    profile = {
+        "user_id": "u1",
+        "evidences": ["top"],
+        "output_reasoning": "why",
+        "hard_skills": [
+            {"value": "python", "level": "expert", "evidences": ["e1"]},
+            {"value": "go", "evidences": []},
+        ],
+        "value_system": {"evidences": ["e2"], "output_reasoning": "kept", "a": 1},
+    }
+
+    result = remove_evidences_from_profile(profile)
+
+    assert result == {
+        "user_id": "u1",
+        "hard_skills": [{"value": "python", "level": "expert"}, {"value": "go"}],
+        "value_system": {"output_reasoning": "kept", "a": 1},
+    }
+    assert list(result) == ["user_id", "hard_skills", "value_system"]
+    assert list(result["hard_skills"][0]) == ["value", "level"]
+    # The input is left untouched
+    assert profile["hard_skills"][0]["evidences"] == ["e1"]
+
+
+def test_handles_nesting_deeper_than_the_recursion_limit():
+    profile = {"root": {}}
+    node = profile["root"]
+    for _ in range(5000):
+        node["child"] = {"evidences": [1]}
+        node = node["child"]
+
+    result = remove_evidences_from_profile(profile)
+
+    node = result["root"]
+    depth = 0
+    while "child" in node:
+        assert "evidences" not in node["child"]
+        node = node["child"]
+        depth += 1
+    assert depth == 5000
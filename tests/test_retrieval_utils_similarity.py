@@ -1,6 +1,9 @@
 """Unit tests for retrieval cosine similarity safety helpers."""
 
+import threading
+
 import numpy as np
+import pytest
 
 from agentic_layer import retrieval_utils
 
@@ -32,3 +35,133 @@ def test_safe_cosine_similarity_returns_score_for_valid_vectors():
         np.array([1.0, 0.0]), 1.0, candidate
     )
     assert score == 1.0
+
+
+def test_embedding_index_top_k_matches_per_candidate_scoring():
+    rng = np.random.default_rng(0)
+    query = rng.normal(size=8)
+    candidates = [Candidate(list(rng.normal(size=8))) for _ in range(30)]
+    query_norm = float(np.linalg.norm(query))
+
+    expected = sorted(
+        (
+            (c, retrieval_utils._safe_cosine_similarity(query, query_norm, c))
+            for c in candidates
+        ),
+        key=lambda x: x[1],
+        reverse=True,
+    )[:5]
+    index = retrieval_utils.CandidateEmbeddingIndex(candidates)
+    results = index.top_k(query, 5)
+
+    assert [c for c, _ in results] == [c for c, _ in expected]
+    assert np.allclose([s for _, s in results], [s for _, s in expected])
+
+
+def test_embedding_index_skips_unusable_embeddings():
+    good = Candidate([1.0, 0.0])
+    candidates = [
+        Candidate([]),
+        Candidate([1.0]),
+        Candidate([0.0, 0.0]),
+        Candidate(["a", 1.0]),
+        good,
+    ]
+    index = retrieval_utils.CandidateEmbeddingIndex(candidates, dim=2)
+    assert index.candidates == [good]
+    assert index.top_k(np.array([1.0, 0.0]), 10) == [(good, 1.0)]
+
+
+def test_embedding_index_rejects_query_dimension_mismatch():
+    index = retrieval_utils.CandidateEmbeddingIndex([Candidate([1.0, 0.0])])
+    assert index.top_k(np.array([1.0, 0.0, 0.0]), 5) == []
+
+
+def test_top_k_indices_orders_best_first():
+    scores = np.array([0.1, 0.9, 0.5, 0.8, 0.3])
+    assert retrieval_utils._top_k_indices(scores, 3).tolist() == [1, 3, 2]
+    assert retrieval_utils._top_k_indices(scores, 10).tolist() == [1, 3, 2, 4, 0]
+    assert retrieval_utils._top_k_indices(scores, 0).tolist() == []
+
+
+@pytest.mark.asyncio
+async def test_multi_query_retrieval_embeds_queries_in_one_batch(monkeypatch):
+    class FakeVectorizeService:
+        def __init__(self):
+            self.batch_calls = 0
+            self.single_calls = 0
+
+        async def get_embeddings(self, texts):
+            self.batch_calls += 1
+            return [np.array([1.0, 0.0] if "a" in t else [0.0, 1.0]) for t in texts]
+
+        async def get_embedding(self, text):
+            self.single_calls += 1
+            return np.array([1.0, 0.0])
+
+    service = FakeVectorizeService()
+    monkeypatch.setattr(retrieval_utils, "get_vectorize_service", lambda: service)
+    monkeypatch.setattr(
+        retrieval_utils, "build_bm25_index", lambda candidates: (None,) * 4
+    )
+
+    a, b = Candidate([1.0, 0.0]), Candidate([0.0, 1.0])
+    results, metadata = await retrieval_utils.multi_query_retrieval(
+        ["a", "b", "aa"], [a, b], emb_top_n=1, final_top_n=2
+    )
+
+    assert service.batch_calls == 1
+    assert service.single_calls == 0
+    assert metadata["num_queries"] == 3
+    assert results[0][0] is a
+
+
+@pytest.mark.asyncio
+async def test_multi_query_retrieval_builds_bm25_index_once(monkeypatch):
+    class FakeVectorizeService:
+        async def get_embeddings(self, texts):
+            return [np.array([1.0, 0.0]) for _ in texts]
+
+    builds = []
+
+    def fake_build_bm25_index(candidates):
+        builds.append(candidates)
+        return (None,) * 4
+
+    monkeypatch.setattr(
+        retrieval_utils, "get_vectorize_service", lambda: FakeVectorizeService()
+    )
+    monkeypatch.setattr(retrieval_utils, "build_bm25_index", fake_build_bm25_index)
+
+    candidates = [Candidate([1.0, 0.0]), Candidate([0.0, 1.0])]
+    await retrieval_utils.multi_query_retrieval(["a", "b", "c"], candidates)
+
+    assert len(builds) == 1
+
+
+@pytest.mark.asyncio
+async def test_lightweight_retrieval_embeds_while_bm25_index_builds(monkeypatch):
+    embedding_started = threading.Event()
+
+    class FakeVectorizeService:
+        async def get_embedding(self, text):
+            embedding_started.set()
+            return np.array([1.0, 0.0])
+
+    overlapped = []
+
+    def fake_build_bm25_index(candidates):
+        overlapped.append(embedding_started.wait(timeout=5))
+        return (None,) * 4
+
+    monkeypatch.setattr(
+        retrieval_utils, "get_vectorize_service", lambda: FakeVectorizeService()
+    )
+    monkeypatch.setattr(retrieval_utils, "build_bm25_index", fake_build_bm25_index)
+
+    a, b = Candidate([1.0, 0.0]), Candidate([0.0, 1.0])
+    results, metadata = await retrieval_utils.lightweight_retrieval("q", [a, b])
+
+    assert overlapped == [True]
+    assert results[0][0] is a
+    assert metadata["emb_count"] == 2
@@ -0,0 +1,45 @@
+"""Unit tests for iter_json_objects and the event log response parser."""
+
+import json
+
+import pytest
+
+from common_utils.text_utils import iter_json_objects
+from memory_layer.memory_extractor.event_log_extractor import EventLogExtractor
+
+
+def test_yields_object_surrounded_by_prose():
+    text = 'Here you go: {"event_log": {"time": "t", "atomic_fact": ["a"]}} Done.'
+    assert [json.loads(s) for s in iter_json_objects(text)] == [
+        {"event_log": {"time": "t", "atomic_fact": ["a"]}}
+    ]
+
+
+def test_ignores_braces_and_escaped_quotes_inside_strings():
+    text = '{"a": "x } y { \\" }", "b": 1} trailing }'
+    assert list(iter_json_objects(text)) == ['{"a": "x } y { \\" }", "b": 1}']
+
+
+def test_yields_every_candidate_in_order_and_skips_unclosed_braces():
+    text = 'see {note} and { unclosed, then {"b": {"c": 1}}'
+    assert list(iter_json_objects(text)) == ["{note}", '{"b": {"c": 1}}']
+
+
+def test_yields_nothing_without_balanced_object():
+    assert list(iter_json_objects("no json here")) == []
+    assert list(iter_json_objects('{"a": 1')) == []
+    assert list(iter_json_objects("")) == []
+
+
+def test_event_log_parser_skips_objects_without_event_log():
+    extractor = EventLogExtractor(llm_provider=None, event_log_prompt="")
+    response = (
+        'Format per {note}, e.g. {"time": "t0"}. Result: '
+        '{"event_log": {"time": "t1", "atomic_fact": ["a"]}}'
+    )
+    assert extractor._parse_llm_response(response) == {
+        "event_log": {"time": "t1", "atomic_fact": ["a"]}
+    }
+
+    with pytest.raises(ValueError):
+        extractor._parse_llm_response('Only an example: {"time": "t0"}')
@@ -0,0 +1,59 @@
+"""Unit tests for BaseVectorizeService.get_embeddings sub-batching."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from agentic_layer.vectorize_vllm import VllmVectorizeConfig, VllmVectorizeService
+
+
+class FakeEmbeddings:
+    def __init__(self):
+        self.inputs = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def create(self, model, input, **kwargs):
+        self.inputs.append(list(input))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return SimpleNamespace(
+            data=[SimpleNamespace(embedding=[float(len(t))]) for t in input]
+        )
+
+
+def make_service(batch_size, max_concurrent_requests):
+    config = VllmVectorizeConfig(
+        batch_size=batch_size,
+        max_concurrent_requests=max_concurrent_requests,
+        dimensions=0,
+    )
+    service = VllmVectorizeService(config)
+    service.client = SimpleNamespace(embeddings=FakeEmbeddings())
+    return service
+
+
+@pytest.mark.asyncio
+async def test_sub_batches_run_concurrently_and_keep_order():
+    service = make_service(batch_size=2, max_concurrent_requests=2)
+    texts = ["a" * n for n in range(1, 8)]
+
+    embeddings = await service.get_embeddings(texts)
+
+    fake = service.client.embeddings
+    assert [e.tolist() for e in embeddings] == [[float(n)] for n in range(1, 8)]
+    assert sorted(map(len, fake.inputs)) == [1, 2, 2, 2]
+    assert fake.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_small_input_is_a_single_request():
+    service = make_service(batch_size=10, max_concurrent_requests=2)
+
+    embeddings = await service.get_embeddings(["x", "yy"])
+
+    assert service.client.embeddings.inputs == [["x", "yy"]]
+    assert [e.tolist() for e in embeddings] == [[1.0], [2.0]]
@@ -0,0 +1,75 @@
+"""Unit tests for the hybrid vectorize service's embedding cache."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from agentic_layer.vectorize_service import (
+    HybridVectorizeConfig,
+    HybridVectorizeService,
+)
+
+
+class FakeEmbeddingService:
+    def __init__(self):
+        self.calls = []
+
+    async def get_embedding(self, text, instruction=None, is_query=False):
+        self.calls.append(text)
+        await asyncio.sleep(0)
+        return np.array([float(len(text)), 1.0], dtype=np.float32)
+
+
+def make_service(cache_size):
+    config = HybridVectorizeConfig()
+    config.embedding_cache_size = cache_size
+    service = HybridVectorizeService(config)
+    service.primary_service = FakeEmbeddingService()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_repeated_text_is_embedded_once():
+    service = make_service(cache_size=8)
+
+    first = await service.get_embedding("hello", is_query=True)
+    first[0] = -1.0  # callers get their own copy
+    second = await service.get_embedding("hello", is_query=True)
+
+    assert service.primary_service.calls == ["hello"]
+    assert second.tolist() == [5.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call():
+    service = make_service(cache_size=8)
+
+    results = await asyncio.gather(
+        *(service.get_embedding("query", is_query=True) for _ in range(3))
+    )
+
+    assert service.primary_service.calls == ["query"]
+    assert all(r.tolist() == [5.0, 1.0] for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cache_is_keyed_by_query_flag_and_bounded():
+    service = make_service(cache_size=2)
+
+    await service.get_embedding("a", is_query=True)
+    await service.get_embedding("a", is_query=False)
+    await service.get_embedding("b")
+    await service.get_embedding("a", is_query=True)  # evicted by "b"
+
+    assert service.primary_service.calls == ["a", "a", "b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_cache_can_be_disabled():
+    service = make_service(cache_size=0)
+
+    await service.get_embedding("x")
+    await service.get_embedding("x")
+
+    assert service.primary_service.calls == ["x", "x"]